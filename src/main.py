@@ -11,8 +11,10 @@ Set MCP_TRANSPORT=sse environment variable to use SSE mode.
 
 import logging
 import os
+from contextlib import asynccontextmanager
 from urllib.parse import urlencode
 
+import anyio
 import httpx
 import uvicorn
 from starlette.applications import Starlette
@@ -35,7 +37,7 @@ from ticktick_mcp.tools import unofficial_tools  # noqa: F401
 logging.info("Tool registration complete.")
 
 # Eager init - login to unofficial API at startup, not on first tool call
-from ticktick_mcp.unofficial_client import UnofficialAPIClient
+from ticktick_mcp.unofficial_client import UnofficialAPIClient, close_client
 try:
     UnofficialAPIClient()
     logging.info("Unofficial API client initialized successfully.")
@@ -106,6 +108,27 @@ async def oauth_callback(request):
 
 # --- Main Execution Logic --- #
 
+# The unofficial client's AsyncClient is shared by every MCP session, so it is
+# closed when the process shuts down rather than from FastMCP's lifespan, which
+# runs per connection in SSE mode.
+
+@asynccontextmanager
+async def app_lifespan(app):
+    """Starlette lifespan for SSE mode: close shared HTTP connections on shutdown."""
+    try:
+        yield
+    finally:
+        await close_client()
+
+
+async def run_stdio():
+    """Serve over stdio, closing shared HTTP connections when the session ends."""
+    try:
+        await mcp.run_stdio_async()
+    finally:
+        await close_client()
+
+
 def main():
     """Run the MCP server in either stdio or SSE mode."""
     # Check transport mode
@@ -141,6 +164,7 @@ def main():
             })
 
         app = Starlette(
+            lifespan=app_lifespan,
             routes=[
                 Route("/sse", endpoint=handle_sse, methods=["GET"]),
                 Mount("/messages", app=sse.handle_post_message),
@@ -159,7 +183,7 @@ def main():
         uvicorn.run(app, host="0.0.0.0", port=port)
     else:
         # stdio mode for local development
-        mcp.run(transport="stdio")
+        anyio.run(run_stdio)
 
 
 if __name__ == "__main__":
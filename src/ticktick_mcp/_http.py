@@ -0,0 +1,39 @@
+"""
+HTTP plumbing shared by the official (ticktick_client.py) and unofficial
+(unofficial_client.py) API clients.
+"""
+
+import json
+from typing import Any
+
+import httpx
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup (the "fast" extra); stdlib json is the fallback
+    orjson = None
+
+try:
+    import h2  # noqa: F401  (httpx only needs it importable to speak HTTP/2)
+    HTTP2_AVAILABLE = True
+except ImportError:  # the "http2" extra (httpx[http2]) provides it
+    HTTP2_AVAILABLE = False
+
+# Idle connections are kept for 30s (httpx default: 5s) so the gaps between an
+# agent's tool calls don't cost a new TLS handshake
+HTTP_LIMITS = httpx.Limits(max_connections=10, max_keepalive_connections=10, keepalive_expiry=30.0)
+HTTP_TIMEOUT = 30.0
+
+
+def decode_json(content: bytes) -> Any:
+    """Parse a response body, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def encode_json(data: Any) -> bytes:
+    """Serialize a request body compactly, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
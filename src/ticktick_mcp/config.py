@@ -2,7 +2,8 @@
 Configuration for TickTick MCP Server.
 Handles dual-client authentication:
 1. Official API (OAuth) - via ticktick_client.py
-2. Unofficial API (direct v2 calls, no caching) - via unofficial_client.py
+2. Unofficial API (direct v2 calls; tools cache reads briefly, see the tuning
+   settings below) - via unofficial_client.py
 """
 
 import argparse
@@ -91,19 +92,13 @@ if not all([CLIENT_ID, CLIENT_SECRET, REDIRECT_URI, USERNAME, PASSWORD]):
 # Use /tmp for cloud deployment (writable), otherwise use config dir for local
 oauth_token_env = os.getenv("TICKTICK_OAUTH_TOKEN")
 if oauth_token_env:
-    # Cloud deployment - write token to /tmp cache
+    # Cloud deployment - token cache lives in /tmp (writable)
     logger.info("Cloud deployment detected (TICKTICK_OAUTH_TOKEN set)")
     dotenv_dir_path = Path("/tmp")
-    token_path = dotenv_dir_path / ".token-oauth"
 
-    # Parse token and add expire_time field for ticktick-py compatibility
+    # The token only needs parsing; nothing reads a .token-oauth file now that
+    # the unofficial client logs in directly instead of through ticktick-py
     token_data = json.loads(oauth_token_env)
-    current_time = int(time.time())
-    token_data['expire_time'] = current_time + token_data.get('expires_in', 15551999)
-
-    # Write corrected token to cache
-    token_path.write_text(json.dumps(token_data))
-    logger.info(f"Wrote OAuth token to: {token_path}")
 
     # Also set ACCESS_TOKEN for official API if not already set
     if not ACCESS_TOKEN:
@@ -114,6 +109,19 @@ else:
     logger.info(f"Local mode, token cache dir: {dotenv_dir_path}")
 
 
+# --- Unofficial API tuning ---
+# Seconds a batch/check snapshot is reused across reads (0 = always fetch fresh)
+SNAPSHOT_TTL = float(os.getenv("TICKTICK_MCP_SNAPSHOT_TTL", "3"))
+# Opt-in: reuse the task from our own last write instead of re-fetching it before the next edit
+TASK_CACHE_ENABLED = os.getenv("TICKTICK_MCP_TASK_CACHE") == "1"
+# Reuse identical experimental_api_call GETs for a second (set to 0 to disable)
+EXPERIMENTAL_CACHE_ENABLED = os.getenv("TICKTICK_MCP_EXPERIMENTAL_CACHE", "1") != "0"
+# Opt-in: coalesce single-task updates made within this many milliseconds into one batch POST
+BATCH_WINDOW_MS = int(os.getenv("TICKTICK_MCP_BATCH_WINDOW_MS", "0"))
+# Seconds a task's activity log is reused for repeat reads (0 = always fetch fresh)
+ACTIVITY_TTL = float(os.getenv("TICKTICK_MCP_ACTIVITY_TTL", "30"))
+
+
 # --- Official API Client Functions ---
 # These use the separate ticktick_client.py which uses httpx for the official OpenAPI
 
@@ -6,9 +6,11 @@ Documentation: https://developer.ticktick.com/docs#/openapi
 """
 
 import httpx
-from typing import Optional, Any
+from typing import Callable, Optional, Any
 import logging
 
+from ._http import HTTP2_AVAILABLE, HTTP_LIMITS, HTTP_TIMEOUT, decode_json, encode_json
+
 logger = logging.getLogger(__name__)
 
 
@@ -35,6 +37,15 @@ class TickTickClient:
 
     BASE_URL = "https://api.ticktick.com/open/v1"
 
+    # Called after every non-GET request, whether or not it succeeded, so other
+    # tools can drop cached reads the write may have made stale
+    _write_listeners: list[Callable[[], None]] = []
+
+    @classmethod
+    def add_write_listener(cls, listener: Callable[[], None]) -> None:
+        """Register a callback to run after every write through any TickTickClient."""
+        cls._write_listeners.append(listener)
+
     def __init__(self, access_token: str, user_id: Optional[str] = None):
         """
         Initialize the TickTick client.
@@ -46,6 +57,12 @@ class TickTickClient:
         self.access_token = access_token
         self.user_id = user_id
         self._client: Optional[httpx.AsyncClient] = None
+        # The token is fixed for the life of this instance (save_tokens() builds a
+        # new client), so the headers are built once rather than per connection
+        self._default_headers = {
+            "Authorization": f"Bearer {access_token}",
+            "Content-Type": "application/json"
+        }
 
     @property
     def inbox_id(self) -> Optional[str]:
@@ -56,10 +73,7 @@ class TickTickClient:
 
     def _headers(self) -> dict[str, str]:
         """Get headers for API requests."""
-        return {
-            "Authorization": f"Bearer {self.access_token}",
-            "Content-Type": "application/json"
-        }
+        return self._default_headers
 
     async def _get_client(self) -> httpx.AsyncClient:
         """Get or create the HTTP client."""
@@ -67,7 +81,9 @@ class TickTickClient:
             self._client = httpx.AsyncClient(
                 base_url=self.BASE_URL,
                 headers=self._headers(),
-                timeout=30.0
+                timeout=HTTP_TIMEOUT,
+                limits=HTTP_LIMITS,
+                http2=HTTP2_AVAILABLE
             )
         return self._client
 
@@ -105,12 +121,12 @@ class TickTickClient:
             response = await client.request(
                 method=method,
                 url=endpoint,
-                json=json,
+                content=encode_json(json) if json is not None else None,
                 params=params
             )
 
             # Log the request/response for debugging
-            logger.debug(f"{method} {endpoint} -> {response.status_code}")
+            logger.debug("%s %s -> %s", method, endpoint, response.status_code)
 
             if response.status_code >= 400:
                 try:
@@ -127,14 +143,18 @@ class TickTickClient:
             if response.status_code == 204 or not response.content:
                 return None
 
-            return response.json()
+            return decode_json(response.content)
 
         except httpx.RequestError as e:
-            logger.error(f"Request error: {e}")
+            logger.error("Request error: %s", e)
             raise TickTickAPIError(
                 status_code=0,
                 message=f"Request failed: {str(e)}"
             )
+        finally:
+            if method != "GET":
+                for listener in self._write_listeners:
+                    listener()
 
     # ==================== Project Operations ====================
 
@@ -481,7 +501,7 @@ class TickTickClient:
                 inbox_data = await self.get_project_with_data(self.inbox_id)
                 all_tasks.extend(inbox_data.get("tasks", []))
             except TickTickAPIError as e:
-                logger.warning(f"Failed to get Inbox tasks: {e}")
+                logger.warning("Failed to get Inbox tasks: %s", e)
 
         # Get all other projects and their tasks
         projects = await self.get_projects()
@@ -490,7 +510,7 @@ class TickTickClient:
                 project_data = await self.get_project_with_data(project["id"])
                 all_tasks.extend(project_data.get("tasks", []))
             except TickTickAPIError as e:
-                logger.warning(f"Failed to get tasks for project {project['id']}: {e}")
+                logger.warning("Failed to get tasks for project %s: %s", project['id'], e)
 
         return all_tasks
 
@@ -23,6 +23,7 @@ from typing import Any
 from zoneinfo import ZoneInfo
 
 from ticktick_mcp.mcp_instance import mcp
+from ticktick_mcp.tools.filters import matches_filter
 from ticktick_mcp.config import get_ticktick_client
 from ticktick_mcp.ticktick_client import TickTickAPIError
 
@@ -96,95 +97,6 @@ def _format_date_for_ticktick(date_str: str | None, time_zone: str | None = None
         return dt.strftime('%Y-%m-%dT%H:%M:%S.000+0000')
 
 
-def _parse_date(date_str: str | None) -> datetime | None:
-    """Parse a date string to datetime for comparison."""
-    if not date_str:
-        return None
-    try:
-        # Handle TickTick format: "2024-07-26T10:00:00+0000" or "2024-07-26T10:00:00.000+0000"
-        clean = date_str.replace(".000", "")
-        # Handle timezone offset format (+0000 vs +00:00)
-        if len(clean) > 5 and clean[-5] in "+-" and ":" not in clean[-5:]:
-            clean = clean[:-2] + ":" + clean[-2:]
-        return datetime.fromisoformat(clean)
-    except (ValueError, TypeError):
-        try:
-            # Try date-only format
-            return datetime.fromisoformat(date_str[:10])
-        except (ValueError, TypeError):
-            return None
-
-
-def _matches_filter(task: dict, filters: dict) -> bool:
-    """Check if a task matches the given filter criteria."""
-    # Status filter (0=uncompleted, 2=completed)
-    status = filters.get("status", "uncompleted")
-    task_status = task.get("status", 0)
-    if status == "uncompleted" and task_status != 0:
-        return False
-    if status == "completed" and task_status != 2:
-        return False
-    # status == "all" allows both
-
-    # Title search filter (case-insensitive substring match)
-    title_contains = filters.get("title_contains")
-    if title_contains:
-        task_title = task.get("title") or ""
-        if title_contains.lower() not in task_title.lower():
-            return False
-
-    # Project filter
-    project_id = filters.get("project_id")
-    if project_id and task.get("projectId") != project_id:
-        return False
-
-    # Tag filter
-    tag_label = filters.get("tag_label")
-    if tag_label:
-        task_tags = task.get("tags") or []
-        if tag_label not in task_tags:
-            return False
-
-    # Priority filter
-    priority = filters.get("priority")
-    if priority is not None and task.get("priority") != priority:
-        return False
-
-    # Due date range filter
-    due_start = filters.get("due_start_date")
-    due_end = filters.get("due_end_date")
-    if due_start or due_end:
-        task_due = _parse_date(task.get("dueDate"))
-        if not task_due:
-            return False  # No due date but filter requires one
-        if due_start:
-            filter_start = _parse_date(due_start)
-            if filter_start and task_due.date() < filter_start.date():
-                return False
-        if due_end:
-            filter_end = _parse_date(due_end)
-            if filter_end and task_due.date() > filter_end.date():
-                return False
-
-    # Completion date range filter (only meaningful for completed tasks)
-    comp_start = filters.get("completion_start_date")
-    comp_end = filters.get("completion_end_date")
-    if comp_start or comp_end:
-        task_completed = _parse_date(task.get("completedTime"))
-        if not task_completed:
-            return False
-        if comp_start:
-            filter_start = _parse_date(comp_start)
-            if filter_start and task_completed.date() < filter_start.date():
-                return False
-        if comp_end:
-            filter_end = _parse_date(comp_end)
-            if filter_end and task_completed.date() > filter_end.date():
-                return False
-
-    return True
-
-
 def _format_task(task: dict) -> dict[str, Any]:
     """Format a task object for display."""
     return {
@@ -995,7 +907,7 @@ async def ticktick_filter_tasks(
         all_tasks = await client.get_all_tasks()
 
         # Apply filters
-        filtered_tasks = [t for t in all_tasks if _matches_filter(t, filters)]
+        filtered_tasks = [t for t in all_tasks if matches_filter(t, filters)]
 
         # Sort by priority if requested (highest first: 5, 3, 1, 0)
         if sort_by_priority:
@@ -2,11 +2,11 @@
 MCP Tools for unofficial TickTick API features.
 
 These tools use direct API calls to unofficial v2 endpoints:
-- Pin/unpin tasks
+- Pin/unpin tasks (singly or in bulk)
 - Recurrence patterns (RRULE, ERULE for specific dates, repeatFrom)
 - Task activity logs
 - Full CRUD operations via unofficial API
-- Fresh data fetches (no caching!)
+- Short-lived read caches (snapshot, activity, experimental GETs), dropped on any write
 - Proper subtask relationships (parentId/childIds via batch/taskParent)
 - Checklist item management (items[] array - add, update, remove, convert)
 
@@ -19,11 +19,26 @@ CHECKLIST ITEMS vs SUBTASKS:
 Requires TICKTICK_USERNAME and TICKTICK_PASSWORD environment variables.
 """
 
+import asyncio
+import copy
 import logging
+import time
+from collections import OrderedDict, defaultdict
 from datetime import datetime, timezone
-from typing import Any, Literal
-
+from types import MappingProxyType
+from typing import Any, Literal, cast
+
+from ticktick_mcp.config import (
+    ACTIVITY_TTL,
+    BATCH_WINDOW_MS,
+    EXPERIMENTAL_CACHE_ENABLED,
+    SNAPSHOT_TTL,
+    TASK_CACHE_ENABLED,
+)
+from ticktick_mcp._http import HTTP_LIMITS
 from ticktick_mcp.mcp_instance import mcp
+from ticktick_mcp.ticktick_client import TickTickClient
+from ticktick_mcp.tools.filters import matches_filter
 from ticktick_mcp.unofficial_client import UnofficialAPIClient, get_client
 
 logger = logging.getLogger(__name__)
@@ -32,6 +47,7 @@ logger = logging.getLogger(__name__)
 # ==================== API Endpoints ====================
 
 BATCH_CHECK = "/api/v2/batch/check/0"
+BATCH_CHECK_SINCE = "/api/v2/batch/check/{check_point}"
 BATCH_TASK = "/api/v2/batch/task"
 BATCH_TASK_PROJECT = "/api/v2/batch/taskProject"
 BATCH_TASK_PARENT = "/api/v2/batch/taskParent"
@@ -39,51 +55,546 @@ TASK_ACTIVITY = "/api/v1/task/activity/{task_id}"
 TASK_BY_ID = "/api/v2/task/{task_id}"
 
 
+# Resolved on first use by _get_api_client()
+_client_cache: UnofficialAPIClient | None = None
+
+
+# ==================== Batch Check Cache ====================
+
+# Agents often chain several reads in one turn (filter, get_all, get_tasks...).
+# Each of those needs the full batch/check payload, so keep the last one around
+# for a few seconds (TICKTICK_MCP_SNAPSHOT_TTL, 0 to disable). Any mutation made
+# through these tools or the official API tools marks it stale.
+#
+# Once stale, the snapshot is refreshed incrementally: batch/check/{checkPoint}
+# only returns what changed since that checkpoint, which is merged into the
+# snapshot. A full download still happens every BATCH_CHECK_FULL_SYNC_INTERVAL
+# seconds so anything the delta merge can't express doesn't linger.
+BATCH_CHECK_MAX_AGE = SNAPSHOT_TTL
+BATCH_CHECK_FULL_SYNC_INTERVAL = 300.0
+
+# Top-level collections a delta can't be merged into: whether the server sends
+# every row or only changed ones (and how removals look) isn't knowable from
+# the response, so a delta that mentions any of them triggers a full sync
+_BATCH_CHECK_COLLECTIONS = ("projectProfiles", "projectGroups", "tags", "filters")
+
+_batch_check_cache: dict[str, Any] = {
+    "data": None, "ts": 0.0, "full_ts": 0.0, "index": None, "in_flight": None
+}
+
+# Bumped by every write. A read that started before a write finishes with
+# pre-write data, so it may answer its own callers but must not refill a cache.
+_write_generation = 0
+
+
+# ==================== Task Cache (opt-in) ====================
+
+# With TICKTICK_MCP_TASK_CACHE=1, the full task from our last successful write
+# (carrying the etag the server returned) is kept so the next edit of the same
+# task can skip its GET. Edits made elsewhere in between would be overwritten,
+# which is why this is off by default.
+TASK_CACHE_SIZE = 256
+
+_task_cache: OrderedDict[str, dict] = OrderedDict()
+
+
+# ==================== Experimental GET Cache ====================
+
+# Identical raw GETs through unofficial_experimental_api_call within a second
+# are answered from here (TICKTICK_MCP_EXPERIMENTAL_CACHE=0 to disable).
+# Cleared along with the batch/check snapshot on every write.
+EXPERIMENTAL_CACHE_TTL = 1.0
+EXPERIMENTAL_CACHE_SIZE = 64
+
+_experimental_get_cache: OrderedDict[tuple[str, str], tuple[float, Any]] = OrderedDict()
+
+
+# ==================== Activity Cache ====================
+
+# Activity logs only change when a task does, so agents re-reading the same
+# task's history get it from here for ACTIVITY_CACHE_TTL seconds
+# (TICKTICK_MCP_ACTIVITY_TTL, 0 to disable). Cleared along with the
+# batch/check snapshot on every write.
+ACTIVITY_CACHE_TTL = ACTIVITY_TTL
+ACTIVITY_CACHE_SIZE = 256
+
+_activity_cache: OrderedDict[str, tuple[float, list[dict]]] = OrderedDict()
+_activity_in_flight: dict[str, asyncio.Future] = {}
+
+
+# ==================== Update Coalescing (opt-in) ====================
+
+class _BatchQueue:
+    """
+    Coalesce single-task batch/task updates into one POST.
+
+    Updates saved within `window` seconds of the first queued one are sent
+    together when the window closes, or as soon as `max_batch` distinct tasks
+    are waiting. Each waiting caller gets the batch response narrowed to its
+    own task's id2etag/id2error entries. Two updates to the same task in one
+    window are last-write-wins, since each is a full task.
+    """
+
+    def __init__(self, window: float, max_batch: int = 50):
+        self.window = window
+        self.max_batch = max_batch
+        self._pending: dict[str, dict] = {}
+        self._waiters: list[tuple[str, asyncio.Future]] = []
+        self._flush_task: asyncio.Task | None = None
+        self._sending: set[asyncio.Task] = set()  # early flushes, referenced until done
+
+    async def enqueue_update(self, client: UnofficialAPIClient, task: dict) -> dict:
+        """Queue a full task for the next flush and wait for the batch response."""
+        future = asyncio.get_running_loop().create_future()
+        self._pending[task["id"]] = task
+        self._waiters.append((task["id"], future))
+        if len(self._pending) >= self.max_batch:
+            # Full batch: send it now instead of waiting out the window
+            if self._flush_task is not None:
+                self._flush_task.cancel()
+                self._flush_task = None
+            send = asyncio.create_task(self._send(client, *self._take_batch()))
+            self._sending.add(send)
+            send.add_done_callback(self._sending.discard)
+        elif self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_after_window(client))
+        return await future
+
+    def _take_batch(self) -> tuple[dict[str, dict], list[tuple[str, asyncio.Future]]]:
+        """Detach the pending updates and their waiters so new ones start a fresh batch."""
+        pending, waiters = self._pending, self._waiters
+        self._pending, self._waiters = {}, []
+        return pending, waiters
+
+    async def _flush_after_window(self, client: UnofficialAPIClient) -> None:
+        await asyncio.sleep(self.window)
+        self._flush_task = None
+        await self._send(client, *self._take_batch())
+
+    async def _send(
+        self,
+        client: UnofficialAPIClient,
+        pending: dict[str, dict],
+        waiters: list[tuple[str, asyncio.Future]]
+    ) -> None:
+        logger.info("Flushing %s coalesced task updates", len(pending))
+        try:
+            result = await _post(client, BATCH_TASK, _batch_payload(update=list(pending.values())))
+        except Exception as e:
+            for _, future in waiters:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for task_id, future in waiters:
+            if not future.done():
+                future.set_result(self._entries_for(result, task_id))
+
+    @staticmethod
+    def _entries_for(result: dict, task_id: str) -> dict:
+        """Narrow a batch response to one task, so no caller sees another's errors."""
+        return {
+            **result,
+            "id2etag": {k: v for k, v in result.get("id2etag", {}).items() if k == task_id},
+            "id2error": {k: v for k, v in result.get("id2error", {}).items() if k == task_id},
+        }
+
+
+# TICKTICK_MCP_BATCH_WINDOW_MS > 0 trades that much latency per write for fewer
+# round-trips when an agent fires several edits at once. Off by default.
+_batch_queue = _BatchQueue(BATCH_WINDOW_MS / 1000) if BATCH_WINDOW_MS > 0 else None
+
+
 # ==================== Helpers ====================
 
 
 def _get_api_client() -> UnofficialAPIClient:
-    """Get the unofficial API client or raise an error."""
-    client = get_client()
-    if not client:
-        raise RuntimeError("Unofficial API not configured. Check TICKTICK_USERNAME and TICKTICK_PASSWORD.")
-    return client
+    """Get the unofficial API client or raise an error.
+
+    The client is a process-wide singleton holding one pooled keep-alive
+    connection, so tools should always go through it rather than open their own.
+    The handle is resolved once and reused for every later tool call.
+    """
+    global _client_cache
+    if _client_cache is None:
+        client = get_client()
+        if not client:
+            raise RuntimeError("Unofficial API not configured. Check TICKTICK_USERNAME and TICKTICK_PASSWORD.")
+        _client_cache = client
+    return _client_cache
+
+
+async def _fetch_all_data(client: UnofficialAPIClient, max_age: float = BATCH_CHECK_MAX_AGE) -> dict:
+    """Fetch all data from batch/check endpoint, reusing a copy up to max_age seconds old."""
+    cached = _batch_check_cache["data"]
+    if cached is not None and time.monotonic() - _batch_check_cache["ts"] < max_age:
+        return cached
+
+    # Concurrent callers (e.g. a gather over several task lookups) share one sync
+    request = _batch_check_cache["in_flight"]
+    if request is None:
+        request = asyncio.ensure_future(_sync_batch_check(client))
+        _batch_check_cache["in_flight"] = request
+        request.add_done_callback(_clear_batch_check_in_flight)
+    return await asyncio.shield(request)
 
 
-def _fetch_all_data(client: UnofficialAPIClient) -> dict:
-    """Fetch all data from batch/check endpoint."""
-    result = client.call_api(BATCH_CHECK)
+def _clear_batch_check_in_flight(request: asyncio.Future) -> None:
+    if _batch_check_cache["in_flight"] is request:
+        _batch_check_cache["in_flight"] = None
+
+
+async def _sync_batch_check(client: UnofficialAPIClient) -> dict:
+    """Refresh the batch/check snapshot, incrementally when a recent checkpoint allows it.
+
+    The result is only stored if no write happened while the request was out.
+    """
+    generation = _write_generation
+    cached = _batch_check_cache["data"]
+    if cached is None:
+        # The client already downloaded everything at startup; use it as the base
+        startup = client.take_startup_snapshot()
+        if startup is not None:
+            _batch_check_cache["full_ts"], cached = startup
+            _batch_check_cache["data"] = cached
+    now = time.monotonic()
+    check_point = cached.get("checkPoint") if cached is not None else None
+    if check_point and now - _batch_check_cache["full_ts"] < BATCH_CHECK_FULL_SYNC_INTERVAL:
+        try:
+            delta = await client.call_api_async(BATCH_CHECK_SINCE.format(check_point=check_point))
+            assert isinstance(delta, dict)
+            merged = _merge_batch_check_delta(cached, delta)
+            if merged is not None:
+                if generation == _write_generation:
+                    _batch_check_cache["data"] = merged
+                    _batch_check_cache["index"] = None
+                    _batch_check_cache["ts"] = time.monotonic()
+                return merged
+            logger.debug("batch/check delta touches projects, folders, tags or filters; doing a full sync")
+        except Exception as e:
+            logger.warning("Incremental batch/check failed, doing a full sync: %s", e)
+
+    result = await client.call_api_async(BATCH_CHECK)
     assert isinstance(result, dict)
+    if generation == _write_generation:
+        _batch_check_cache["data"] = result
+        _batch_check_cache["index"] = None
+        _batch_check_cache["ts"] = _batch_check_cache["full_ts"] = time.monotonic()
     return result
 
 
-def _get_task_by_id(client: UnofficialAPIClient, task_id: str) -> dict | None:
-    """Fetch a task by ID from the batch/check data."""
-    data = _fetch_all_data(client)
-    tasks = data.get("syncTaskBean", {}).get("update", [])
-    for task in tasks:
-        if task.get("id") == task_id:
-            return task
+class _IndexedSnapshot:
+    """Task lookups over one batch/check payload, indexed in a single pass."""
+
+    def __init__(self, data: dict):
+        self.data = data
+        self.by_id: dict[str, dict] = {}
+        self.by_project: defaultdict[str, defaultdict[int, list[dict]]] = defaultdict(lambda: defaultdict(list))
+        for task in _tasks_of(data):
+            self.by_id[task.get("id")] = task
+            self.by_project[task.get("projectId")][task.get("status")].append(task)
+
+    def get_task(self, task_id: str) -> dict | None:
+        """Return the snapshot's copy of a task, or None if it isn't in the snapshot."""
+        return self.by_id.get(task_id)
+
+    def tasks_for(self, project_id: str, statuses: tuple[int, ...]) -> list[dict]:
+        """Return a project's tasks with the given statuses, grouped in that order."""
+        buckets = self.by_project.get(project_id)
+        if not buckets:
+            return []
+        return [task for status in statuses for task in buckets.get(status, ())]
+
+
+def _index_of(data: dict) -> _IndexedSnapshot:
+    """Return the index for the cached snapshot, building it on first use."""
+    index = _batch_check_cache["index"]
+    if index is None or index.data is not data:
+        index = _IndexedSnapshot(data)
+        if data is _batch_check_cache["data"]:
+            _batch_check_cache["index"] = index
+    return index
+
+
+def _fresh_snapshot() -> _IndexedSnapshot | None:
+    """Return the cached snapshot indexed if it is still within its TTL, without fetching."""
+    data = _batch_check_cache["data"]
+    if data is None or time.monotonic() - _batch_check_cache["ts"] >= BATCH_CHECK_MAX_AGE:
+        return None
+    return _index_of(data)
+
+
+async def _fetch_snapshot(client: UnofficialAPIClient) -> _IndexedSnapshot:
+    """Fetch batch/check data (see _fetch_all_data) and return it indexed.
+
+    The index is built once per snapshot and reused until the snapshot changes.
+    """
+    return _index_of(await _fetch_all_data(client))
+
+
+def _tasks_of(data: dict) -> list[dict]:
+    """Return the task list (syncTaskBean.update) from a batch/check payload."""
+    sync = data.get("syncTaskBean")
+    return (sync.get("update") if sync else None) or []
+
+
+def _merge_batch_check_delta(base: dict, delta: dict) -> dict | None:
+    """
+    Apply an incremental batch/check response on top of a previous snapshot.
+
+    Returns None when the delta can't be merged faithfully (it carries any of
+    _BATCH_CHECK_COLLECTIONS, even as an empty list) and a full sync is needed.
+    Tasks that stopped being open are dropped, since a full sync only lists
+    open tasks.
+    """
+    if any(delta.get(key) is not None for key in _BATCH_CHECK_COLLECTIONS):
+        return None
+
+    merged = dict(base)
+    sync = delta.get("syncTaskBean") or {}
+    updated = sync.get("update") or []
+    deleted = {d.get("taskId") for d in sync.get("delete") or []}
+    if updated or deleted:
+        tasks = {t.get("id"): t for t in _tasks_of(base)}
+        for task_id in deleted:
+            tasks.pop(task_id, None)
+        for task in updated:
+            if task.get("status", 0) == 0:
+                tasks[task.get("id")] = task
+            else:
+                tasks.pop(task.get("id"), None)
+        merged["syncTaskBean"] = {**(base.get("syncTaskBean") or {}), "update": list(tasks.values())}
+
+    if delta.get("checkPoint"):
+        merged["checkPoint"] = delta["checkPoint"]
+    return merged
+
+
+def _invalidate_batch_check_cache() -> None:
+    """Mark the cached batch/check payload (and other cached reads) stale after a write."""
+    global _write_generation
+    _write_generation += 1
+    _batch_check_cache["ts"] = 0.0
+    _batch_check_cache["in_flight"] = None  # later readers must not join a pre-write sync
+    _experimental_get_cache.clear()
+    _activity_cache.clear()
+    _activity_in_flight.clear()
+
+
+# Writes through the official API tools change the same account
+TickTickClient.add_write_listener(_invalidate_batch_check_cache)
+
+
+def _batch_payload(
+    add: list[dict] | None = None,
+    update: list[dict] | None = None,
+    delete: list[dict] | None = None
+) -> dict[str, list[dict]]:
+    """Build a batch/task request body; omitted sections are sent as empty lists."""
+    return {"add": add or [], "update": update or [], "delete": delete or []}
+
+
+async def _post(client: UnofficialAPIClient, endpoint: str, payload: dict | list) -> dict:
+    """POST a mutation and invalidate the batch/check cache.
+
+    The batch endpoints always answer with an object ({"id2etag": ..., "id2error": ...}).
+    """
+    try:
+        return cast(dict, await client.call_api_async(endpoint, method="POST", data=payload))
+    finally:
+        _invalidate_batch_check_cache()
+
+
+async def _get_task_by_id(client: UnofficialAPIClient, task_id: str) -> dict | None:
+    """Fetch a single task by ID, or None if it doesn't exist.
+
+    Uses the task endpoint rather than scanning batch/check, so only that one
+    task is downloaded and parsed. Works for completed tasks too.
+    """
+    try:
+        task = await client.call_api_async(TASK_BY_ID.format(task_id=task_id))
+    except RuntimeError as e:
+        if "task_not_found" in str(e):
+            return None
+        raise
+    return task or None
+
+
+async def _get_task_for_update(client: UnofficialAPIClient, task_id: str) -> dict | None:
+    """Get the full task to modify, from the opt-in task cache if possible."""
+    if TASK_CACHE_ENABLED:
+        cached = _task_cache.get(task_id)
+        if cached is not None:
+            _task_cache.move_to_end(task_id)
+            return copy.deepcopy(cached)
+    return await _get_task_by_id(client, task_id)
+
+
+def _remember_task(task: dict) -> None:
+    """Cache a task exactly as it was just written (no-op unless the task cache is on)."""
+    if not TASK_CACHE_ENABLED:
+        return
+    _task_cache[task["id"]] = copy.deepcopy(task)
+    _task_cache.move_to_end(task["id"])
+    while len(_task_cache) > TASK_CACHE_SIZE:
+        _task_cache.popitem(last=False)
+
+
+def _forget_task(task_id: str) -> None:
+    """Drop a task from the task cache after a change we can't mirror locally."""
+    _task_cache.pop(task_id, None)
+
+
+def _find_task_with_etag(task_id: str, etag: str) -> dict | None:
+    """
+    Return a copy of a full task we already hold locally at exactly this etag.
+
+    Looks in the opt-in task cache and in the batch/check snapshot while it is
+    within its TTL. A matching etag means the copy is the version the caller
+    last saw, so it can stand in for a GET. An older snapshot may predate edits
+    made elsewhere, so it is never used; the caller fetches the task instead.
+    """
+    candidates = [_task_cache.get(task_id) if TASK_CACHE_ENABLED else None]
+    snapshot = _fresh_snapshot()
+    if snapshot is not None:
+        candidates.append(snapshot.get_task(task_id))
+    for task in candidates:
+        if task is not None and task.get("etag") == etag:
+            return copy.deepcopy(task)
     return None
 
 
+async def _save_task(client: UnofficialAPIClient, task: dict, cacheable: bool = True) -> dict:
+    """Write a full task back through batch/task and record its new etag.
+
+    On success the etag is updated in place and, if cacheable, the task is
+    remembered for the next edit. Returns the raw batch response.
+    """
+    task_id = task["id"]
+    if _batch_queue is not None:
+        result = await _batch_queue.enqueue_update(client, task)
+    else:
+        result = await _post(client, BATCH_TASK, _batch_payload(update=[task]))
+    if result.get("id2error", {}).get(task_id):
+        _forget_task(task_id)
+        return result
+
+    if task_id in result.get("id2etag", {}):
+        task["etag"] = result["id2etag"][task_id]
+    if cacheable:
+        _remember_task(task)
+    else:
+        _forget_task(task_id)
+    return result
+
+
+async def _get_task_pair(
+    client: UnofficialAPIClient,
+    first_id: str,
+    second_id: str
+) -> tuple[dict | None, dict | None]:
+    """Fetch two tasks by ID concurrently; each is None if it doesn't exist."""
+    first, second = await asyncio.gather(
+        _get_task_by_id(client, first_id),
+        _get_task_by_id(client, second_id),
+    )
+    return first, second
+
+
+async def _get_activity(client: UnofficialAPIClient, task_id: str) -> list[dict]:
+    """Fetch a task's activity log, reusing a copy up to ACTIVITY_CACHE_TTL seconds old."""
+    cached = _activity_cache.get(task_id)
+    if cached is not None and time.monotonic() - cached[0] < ACTIVITY_CACHE_TTL:
+        return cached[1]
+
+    # Concurrent callers for the same task share one request
+    request = _activity_in_flight.get(task_id)
+    if request is None:
+        request = asyncio.ensure_future(_load_activity(client, task_id))
+        _activity_in_flight[task_id] = request
+        request.add_done_callback(lambda done: _clear_activity_in_flight(task_id, done))
+    return await asyncio.shield(request)
+
+
+def _clear_activity_in_flight(task_id: str, request: asyncio.Future) -> None:
+    if _activity_in_flight.get(task_id) is request:
+        del _activity_in_flight[task_id]
+
+
+async def _load_activity(client: UnofficialAPIClient, task_id: str) -> list[dict]:
+    """Request a task's activity log and cache it, unless a write happened meanwhile."""
+    generation = _write_generation
+    activities = cast(list, await client.call_api_async(TASK_ACTIVITY.format(task_id=task_id)))
+
+    if generation == _write_generation:
+        _activity_cache[task_id] = (time.monotonic(), activities)
+        _activity_cache.move_to_end(task_id)
+        while len(_activity_cache) > ACTIVITY_CACHE_SIZE:
+            _activity_cache.popitem(last=False)
+    return activities
+
+
+def _now_timestamp() -> str:
+    """Current UTC time in TickTick's timestamp format (e.g. 2026-02-06T14:00:00.000+0000)."""
+    dt = datetime.now(timezone.utc)
+    return (
+        f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d}"
+        f"T{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}.000+0000"
+    )
+
+
+# Friendly repeat_from names (lowercase, underscores) -> API repeatFrom values
+_REPEAT_FROM_MAP = MappingProxyType({
+    "due_date": "0",
+    "due date": "0",
+    "duedate": "0",
+    "due": "0",
+    "0": "0",
+    "completion_date": "1",
+    "completion date": "1",
+    "completiondate": "1",
+    "completion": "1",
+    "1": "1",
+})
+
+# Spaces and hyphens in friendly names ("due date", "completion-date") map to "_"
+_REPEAT_FROM_SEPARATORS = str.maketrans(" -", "__")
+
+
+# Time-of-day suffix TickTick's web app uses for an ERULE's repeatFirstDate
+_REPEAT_FIRST_DATE_TIME = "T05:00:00.000+0000"
+
+
+def _specific_dates_fields(dates: list[str]) -> dict[str, str]:
+    """Build the ERULE repeat fields for a list of YYYY-MM-DD dates, sorting them once."""
+    if not dates:
+        raise ValueError("specific_dates must contain at least one date")
+    sorted_dates = sorted(dates)
+    formatted_dates = ",".join(d.replace("-", "") for d in sorted_dates)
+    return {
+        "repeatFlag": f"ERULE:NAME=CUSTOM;BYDATE={formatted_dates}",
+        "repeatFirstDate": sorted_dates[0] + _REPEAT_FIRST_DATE_TIME,
+        "repeatFrom": "0",
+    }
+
+
 def _normalize_repeat_from(value: str | None) -> str | None:
     """Convert friendly repeat_from names to API values."""
     if value is None:
         return None
-    normalized = value.lower().replace(" ", "_").replace("-", "_")
-    if normalized in ("completion_date", "completion", "1"):
-        return "1"
-    elif normalized in ("due_date", "due", "0"):
-        return "0"
-    return value  # Pass through if already "0" or "1"
+    if value in _REPEAT_FROM_MAP:  # Already a known spelling ("0", "due_date", "due date", ...)
+        return _REPEAT_FROM_MAP[value]
+    normalized = value.casefold()
+    if normalized in _REPEAT_FROM_MAP:
+        return _REPEAT_FROM_MAP[normalized]
+    normalized = normalized.translate(_REPEAT_FROM_SEPARATORS)
+    return _REPEAT_FROM_MAP.get(normalized, value)  # Pass through anything unrecognized
 
 
 # ==================== Activity & Pin Tools ====================
 
 
 @mcp.tool()
-def unofficial_get_task_activity(task_id: str) -> dict[str, Any] | list[dict]:
+async def unofficial_get_task_activity(task_id: str) -> dict[str, Any] | list[dict]:
     """
     Get the activity log for a specific task.
 
@@ -102,21 +613,66 @@ def unofficial_get_task_activity(task_id: str) -> dict[str, Any] | list[dict]:
     Returns:
         List of activity entries or error dict
     """
-    logger.info(f"unofficial_get_task_activity called for task: {task_id}")
+    logger.debug("unofficial_get_task_activity called for task: %s", task_id)
 
     try:
         client = _get_api_client()
-        endpoint = TASK_ACTIVITY.format(task_id=task_id)
-        activities = client.call_api(endpoint)
-        logger.info(f"Got {len(activities)} activity entries")
+        activities = await _get_activity(client, task_id)
+        logger.info("Got %s activity entries", len(activities))
         return activities
     except Exception as e:
-        logger.error(f"Failed to get task activity: {e}")
+        logger.error("Failed to get task activity: %s", e)
+        return {"error": str(e)}
+
+
+@mcp.tool()
+async def unofficial_get_task_activities(
+    task_ids: list[str],
+    max_concurrency: int = 6
+) -> dict[str, Any]:
+    """
+    Get the activity logs for several tasks at once.
+
+    Prefer this over calling unofficial_get_task_activity repeatedly. Logs are
+    fetched concurrently, at most max_concurrency at a time.
+
+    Args:
+        task_ids: The task IDs
+        max_concurrency: Maximum simultaneous requests (capped at the connection pool size)
+
+    Returns:
+        Dict with activity entries per task ID and per-task errors
+    """
+    logger.debug("unofficial_get_task_activities called for %s tasks", len(task_ids))
+
+    try:
+        client = _get_api_client()
+        limit = max(1, min(max_concurrency, HTTP_LIMITS.max_connections or max_concurrency))
+        semaphore = asyncio.Semaphore(limit)
+
+        async def fetch(task_id: str) -> list[dict]:
+            async with semaphore:
+                return await _get_activity(client, task_id)
+
+        results = await asyncio.gather(*(fetch(task_id) for task_id in task_ids), return_exceptions=True)
+
+        activities = {}
+        errors = {}
+        for task_id, result in zip(task_ids, results):
+            if isinstance(result, Exception):
+                errors[task_id] = str(result)
+            else:
+                activities[task_id] = result
+
+        logger.info("Got activity for %s of %s tasks", len(activities), len(task_ids))
+        return {"success": not errors, "activities": activities, "errors": errors}
+    except Exception as e:
+        logger.error("Failed to get task activities: %s", e)
         return {"error": str(e)}
 
 
 @mcp.tool()
-def unofficial_pin_task(task_id: str) -> dict[str, Any]:
+async def unofficial_pin_task(task_id: str) -> dict[str, Any]:
     """
     Pin a task to the top of the list.
 
@@ -128,36 +684,35 @@ def unofficial_pin_task(task_id: str) -> dict[str, Any]:
     Returns:
         Success message or error
     """
-    logger.info(f"unofficial_pin_task called for task: {task_id}")
+    logger.debug("unofficial_pin_task called for task: %s", task_id)
 
     try:
         client = _get_api_client()
 
         # Fetch the FULL task first (critical - partial updates strip fields!)
-        task = client.call_api(f"/api/v2/task/{task_id}")
+        task = await _get_task_for_update(client, task_id)
         if not task:
             return {"error": f"Task not found: {task_id}"}
 
         # Set pinnedTime to current timestamp
-        now = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.000+0000")
+        now = _now_timestamp()
         task["pinnedTime"] = now
 
         # Send the FULL task back
-        payload = {"add": [], "update": [task], "delete": []}
-        result = client.call_api(BATCH_TASK, method="POST", data=payload)
+        result = await _save_task(client, task)
 
-        if isinstance(result, dict) and result.get("id2error", {}).get(task_id):
+        if result.get("id2error", {}).get(task_id):
             return {"error": f"Pin failed: {result['id2error'][task_id]}"}
 
-        logger.info(f"Successfully pinned task {task_id}")
+        logger.info("Successfully pinned task %s", task_id)
         return {"success": True, "message": f"Task {task_id} pinned", "pinnedTime": now}
     except Exception as e:
-        logger.error(f"Failed to pin task: {e}")
+        logger.error("Failed to pin task: %s", e)
         return {"error": str(e)}
 
 
 @mcp.tool()
-def unofficial_unpin_task(task_id: str) -> dict[str, Any]:
+async def unofficial_unpin_task(task_id: str) -> dict[str, Any]:
     """
     Unpin a task (remove from pinned list).
 
@@ -167,13 +722,13 @@ def unofficial_unpin_task(task_id: str) -> dict[str, Any]:
     Returns:
         Success message or error
     """
-    logger.info(f"unofficial_unpin_task called for task: {task_id}")
+    logger.debug("unofficial_unpin_task called for task: %s", task_id)
 
     try:
         client = _get_api_client()
 
         # Fetch the FULL task first (critical - partial updates strip fields!)
-        task = client.call_api(f"/api/v2/task/{task_id}")
+        task = await _get_task_for_update(client, task_id)
         if not task:
             return {"error": f"Task not found: {task_id}"}
 
@@ -181,24 +736,278 @@ def unofficial_unpin_task(task_id: str) -> dict[str, Any]:
         task["pinnedTime"] = "-1"
 
         # Send the FULL task back
-        payload = {"add": [], "update": [task], "delete": []}
-        result = client.call_api(BATCH_TASK, method="POST", data=payload)
+        result = await _save_task(client, task)
 
-        if isinstance(result, dict) and result.get("id2error", {}).get(task_id):
+        if result.get("id2error", {}).get(task_id):
             return {"error": f"Unpin failed: {result['id2error'][task_id]}"}
 
-        logger.info(f"Successfully unpinned task {task_id}")
+        logger.info("Successfully unpinned task %s", task_id)
         return {"success": True, "message": f"Task {task_id} unpinned"}
     except Exception as e:
-        logger.error(f"Failed to unpin task: {e}")
+        logger.error("Failed to unpin task: %s", e)
+        return {"error": str(e)}
+
+
+@mcp.tool()
+async def unofficial_configure_task(
+    task_id: str,
+    pin: bool | None = None,
+    repeat_from: str | None = None
+) -> dict[str, Any]:
+    """
+    Pin/unpin a task and set its repeat_from in a single update.
+
+    Use this instead of chaining unofficial_pin_task and unofficial_update_task
+    when changing both; the task is fetched and saved once.
+
+    Args:
+        task_id: The task ID
+        pin: True to pin, False to unpin, None to leave as is
+        repeat_from: When to calculate the next occurrence, or None to leave as is:
+            - "due_date" or "0" = From the due date
+            - "completion_date" or "1" = From when task was completed
+
+    Returns:
+        Updated task or error
+    """
+    logger.debug("unofficial_configure_task called for task: %s", task_id)
+
+    if pin is None and repeat_from is None:
+        return {"error": "Nothing to change: pass pin and/or repeat_from"}
+
+    try:
+        client = _get_api_client()
+
+        # Fetch the FULL task first (critical - partial updates strip fields!)
+        task = await _get_task_for_update(client, task_id)
+        if not task:
+            return {"error": f"Task not found: {task_id}"}
+
+        if pin is not None:
+            task["pinnedTime"] = _now_timestamp() if pin else "-1"
+        if repeat_from is not None:
+            task["repeatFrom"] = _normalize_repeat_from(repeat_from)
+
+        result = await _save_task(client, task)
+
+        if result.get("id2error", {}).get(task_id):
+            return {"error": f"Configure failed: {result['id2error'][task_id]}"}
+
+        logger.info("Successfully configured task %s", task_id)
+        return {"success": True, "task": task}
+    except Exception as e:
+        logger.error("Failed to configure task: %s", e)
         return {"error": str(e)}
 
 
-# ==================== Data Fetch Tools (FRESH - NO CACHE) ====================
+async def _fetch_tasks(client: UnofficialAPIClient, task_ids: list[str]) -> tuple[list[dict], dict[str, str]]:
+    """Fetch full tasks by ID, returning (found tasks, {task_id: error}) for the rest."""
+    tasks = []
+    errors = {}
+    fetched = await asyncio.gather(
+        *(_get_task_for_update(client, task_id) for task_id in task_ids),
+        return_exceptions=True,
+    )
+    for task_id, task in zip(task_ids, fetched):
+        if isinstance(task, Exception):
+            errors[task_id] = str(task)
+        elif task:
+            tasks.append(task)
+        else:
+            errors[task_id] = "Task not found"
+    return tasks, errors
+
+
+async def _batch_update_tasks(
+    client: UnofficialAPIClient,
+    tasks: list[dict],
+    errors: dict[str, str]
+) -> list[str]:
+    """Send full tasks in a single batch update; return IDs that succeeded."""
+    if not tasks:
+        return []
+    result = await _post(client, BATCH_TASK, _batch_payload(update=tasks))
+    id2error = result.get("id2error", {})
+    id2etag = result.get("id2etag", {})
+    updated = []
+    for task in tasks:
+        if id2error.get(task["id"]):
+            errors[task["id"]] = str(id2error[task["id"]])
+            _forget_task(task["id"])
+        else:
+            if task["id"] in id2etag:
+                task["etag"] = id2etag[task["id"]]
+            _remember_task(task)
+            updated.append(task["id"])
+    return updated
+
+
+@mcp.tool()
+async def unofficial_pin_tasks(task_ids: list[str]) -> dict[str, Any]:
+    """
+    Pin several tasks at once with a single batch update.
+
+    Prefer this over calling unofficial_pin_task repeatedly.
+
+    Args:
+        task_ids: The task IDs to pin
+
+    Returns:
+        Dict with pinned task IDs, pinnedTime, and per-task errors
+    """
+    logger.debug("unofficial_pin_tasks called for %s tasks", len(task_ids))
+
+    try:
+        client = _get_api_client()
+
+        # Full tasks are required - partial updates strip fields
+        tasks, errors = await _fetch_tasks(client, task_ids)
+
+        now = _now_timestamp()
+        for task in tasks:
+            task["pinnedTime"] = now
+
+        pinned = await _batch_update_tasks(client, tasks, errors)
+
+        logger.info("Pinned %s of %s tasks", len(pinned), len(task_ids))
+        return {"success": not errors, "pinned": pinned, "pinnedTime": now, "errors": errors}
+    except Exception as e:
+        logger.error("Failed to pin tasks: %s", e)
+        return {"error": str(e)}
 
 
 @mcp.tool()
-def unofficial_get_task(task_id: str) -> dict[str, Any]:
+async def unofficial_unpin_tasks(task_ids: list[str]) -> dict[str, Any]:
+    """
+    Unpin several tasks at once with a single batch update.
+
+    Prefer this over calling unofficial_unpin_task repeatedly.
+
+    Args:
+        task_ids: The task IDs to unpin
+
+    Returns:
+        Dict with unpinned task IDs and per-task errors
+    """
+    logger.debug("unofficial_unpin_tasks called for %s tasks", len(task_ids))
+
+    try:
+        client = _get_api_client()
+
+        # Full tasks are required - partial updates strip fields
+        tasks, errors = await _fetch_tasks(client, task_ids)
+
+        for task in tasks:
+            task["pinnedTime"] = "-1"
+
+        unpinned = await _batch_update_tasks(client, tasks, errors)
+
+        logger.info("Unpinned %s of %s tasks", len(unpinned), len(task_ids))
+        return {"success": not errors, "unpinned": unpinned, "errors": errors}
+    except Exception as e:
+        logger.error("Failed to unpin tasks: %s", e)
+        return {"error": str(e)}
+
+
+@mcp.tool()
+async def unofficial_set_repeat_from_tasks(task_ids: list[str], repeat_from: str) -> dict[str, Any]:
+    """
+    Set repeat_from on several recurring tasks at once with a single batch update.
+
+    Prefer this over calling unofficial_update_task repeatedly.
+
+    Args:
+        task_ids: The task IDs to update
+        repeat_from: When to calculate the next occurrence:
+            - "due_date" or "0" = From the due date
+            - "completion_date" or "1" = From when task was completed
+
+    Returns:
+        Dict with updated task IDs, the repeatFrom value applied, and per-task errors
+    """
+    logger.debug("unofficial_set_repeat_from_tasks called for %s tasks", len(task_ids))
+
+    try:
+        client = _get_api_client()
+        api_value = _normalize_repeat_from(repeat_from)
+
+        # Full tasks are required - partial updates strip fields
+        tasks, errors = await _fetch_tasks(client, task_ids)
+
+        for task in tasks:
+            task["repeatFrom"] = api_value
+
+        updated = await _batch_update_tasks(client, tasks, errors)
+
+        logger.info("Set repeatFrom=%s on %s of %s tasks", api_value, len(updated), len(task_ids))
+        return {"success": not errors, "updated": updated, "repeatFrom": api_value, "errors": errors}
+    except Exception as e:
+        logger.error("Failed to set repeat_from on tasks: %s", e)
+        return {"error": str(e)}
+
+
+@mcp.tool()
+async def unofficial_batch_update_tasks(updates: list[dict]) -> dict[str, Any]:
+    """
+    Apply field changes to several tasks with a single batch update.
+
+    Each update is merged into the full current task before sending, so
+    fields you don't mention are preserved. Use unofficial_move_task to
+    change a task's project.
+
+    Args:
+        updates: One dict per task with "id" plus the raw v2 API fields to
+            change, e.g. [{"id": "abc", "title": "New title", "priority": 5}].
+            Each task may appear only once; "projectId" and "etag" are rejected.
+
+    Returns:
+        Dict with updated task IDs and per-task errors
+    """
+    logger.debug("unofficial_batch_update_tasks called for %s tasks", len(updates))
+
+    try:
+        client = _get_api_client()
+
+        changes = {}
+        errors = {}
+        for update in updates:
+            task_id = update.get("id")
+            if not task_id:
+                return {"error": "Every update needs an 'id'"}
+            if task_id in changes or task_id in errors:
+                # Two updates for one task would race each other; make the caller merge them
+                changes.pop(task_id, None)
+                errors[task_id] = "Task appears more than once in updates; merge its changes into one dict"
+                continue
+            if "projectId" in update:
+                errors[task_id] = "projectId can't be changed here; use unofficial_move_task"
+                continue
+            if "etag" in update:
+                errors[task_id] = "etag is set by the server and can't be changed"
+                continue
+            changes[task_id] = update
+
+        # Full tasks are required - partial updates strip fields
+        tasks, fetch_errors = await _fetch_tasks(client, list(changes))
+        errors.update(fetch_errors)
+
+        for task in tasks:
+            task.update(changes[task["id"]])
+
+        updated = await _batch_update_tasks(client, tasks, errors)
+
+        logger.info("Updated %s of %s tasks", len(updated), len(updates))
+        return {"success": not errors, "updated": updated, "errors": errors}
+    except Exception as e:
+        logger.error("Failed to batch update tasks: %s", e)
+        return {"error": str(e)}
+
+
+# ==================== Data Fetch Tools ====================
+
+
+@mcp.tool()
+async def unofficial_get_task(task_id: str) -> dict[str, Any]:
     """
     Get a TickTick task by ID via the unofficial API.
 
@@ -211,32 +1020,36 @@ def unofficial_get_task(task_id: str) -> dict[str, Any]:
     Returns:
         Task data or error dict
     """
-    logger.info(f"unofficial_get_task called for: {task_id}")
+    logger.debug("unofficial_get_task called for: %s", task_id)
 
     try:
         client = _get_api_client()
-        task = client.call_api(f"/api/v2/task/{task_id}")
-        logger.info(f"Found task: {task_id}")
-        return task
-
-    except RuntimeError as e:
-        if "task_not_found" in str(e):
+        task = await _get_task_by_id(client, task_id)
+        if not task:
             return {"error": f"Task not found: {task_id}"}
-        logger.error(f"Failed to get task: {e}")
-        return {"error": str(e)}
+        logger.info("Found task: %s", task_id)
+        return task
     except Exception as e:
-        logger.error(f"Failed to get task: {e}")
+        logger.error("Failed to get task: %s", e)
         return {"error": str(e)}
 
 
+# obj_type -> accessor into the batch/check payload for unofficial_get_all
+_GET_ALL_GETTERS = {
+    "projects": lambda data: data.get("projectProfiles") or [],
+    "tags": lambda data: data.get("tags") or [],
+}
+
+
 @mcp.tool()
-def unofficial_get_all(
+async def unofficial_get_all(
     obj_type: Literal["projects", "tags"]
 ) -> dict[str, Any] | list[dict]:
     """
     Get all projects or tags via the unofficial API.
 
-    ALWAYS returns fresh data - no caching.
+    Data is at most a few seconds old; writes made through these tools are
+    always reflected immediately.
 
     For tasks, use unofficial_filter_tasks() instead — it supports filtering
     by status, project, tag, date range, priority, and title search to avoid
@@ -248,35 +1061,33 @@ def unofficial_get_all(
     Returns:
         List of objects or error dict
     """
-    logger.info(f"unofficial_get_all called for type: {obj_type}")
+    logger.debug("unofficial_get_all called for type: %s", obj_type)
 
     try:
         client = _get_api_client()
-        data = _fetch_all_data(client)
-
-        if obj_type == "projects":
-            result = data.get("projectProfiles", [])
-        elif obj_type == "tags":
-            result = data.get("tags", [])
-        else:
+        getter = _GET_ALL_GETTERS.get(obj_type)
+        if getter is None:
             return {"error": f"Unknown object type: {obj_type}. Use unofficial_filter_tasks() for tasks."}
 
-        logger.info(f"Retrieved {len(result)} {obj_type} (fresh)")
+        result = getter(await _fetch_all_data(client))
+
+        logger.info("Retrieved %s %s", len(result), obj_type)
         return result
     except Exception as e:
-        logger.error(f"Failed to get all {obj_type}: {e}")
+        logger.error("Failed to get all %s: %s", obj_type, e)
         return {"error": str(e)}
 
 
 @mcp.tool()
-def unofficial_get_tasks_from_project(
+async def unofficial_get_tasks_from_project(
     project_id: str,
     include_completed: bool = False
 ) -> dict[str, Any] | list[dict]:
     """
     Get tasks from a specific project via the unofficial API.
 
-    ALWAYS returns fresh data - no caching.
+    Data is at most a few seconds old; writes made through these tools are
+    always reflected immediately.
 
     Args:
         project_id: The project ID to get tasks from
@@ -285,108 +1096,24 @@ def unofficial_get_tasks_from_project(
     Returns:
         List of tasks or error dict
     """
-    logger.info(f"unofficial_get_tasks_from_project called for project: {project_id}")
+    logger.debug("unofficial_get_tasks_from_project called for project: %s", project_id)
 
     try:
         client = _get_api_client()
-        data = _fetch_all_data(client)
-        all_tasks = data.get("syncTaskBean", {}).get("update", [])
+        snapshot = await _fetch_snapshot(client)
 
-        # Filter to this project, uncompleted (status=0)
-        tasks = [t for t in all_tasks if t.get("projectId") == project_id and t.get("status") == 0]
+        # Uncompleted (status=0) first, then optionally completed (status=2)
+        tasks = snapshot.tasks_for(project_id, (0, 2) if include_completed else (0,))
 
-        # Optionally include completed (status=2)
-        if include_completed:
-            completed = [t for t in all_tasks if t.get("projectId") == project_id and t.get("status") == 2]
-            tasks.extend(completed)
-
-        logger.info(f"Retrieved {len(tasks)} tasks from project {project_id} (fresh)")
+        logger.info("Retrieved %s tasks from project %s", len(tasks), project_id)
         return tasks
     except Exception as e:
-        logger.error(f"Failed to get tasks from project: {e}")
+        logger.error("Failed to get tasks from project: %s", e)
         return {"error": str(e)}
 
 
-def _parse_date(date_str: str | None) -> datetime | None:
-    """Parse a date string to datetime for comparison."""
-    if not date_str:
-        return None
-    try:
-        clean = date_str.replace(".000", "")
-        if len(clean) > 5 and clean[-5] in "+-" and ":" not in clean[-5:]:
-            clean = clean[:-2] + ":" + clean[-2:]
-        return datetime.fromisoformat(clean)
-    except (ValueError, TypeError):
-        try:
-            return datetime.fromisoformat(date_str[:10])
-        except (ValueError, TypeError):
-            return None
-
-
-def _matches_filter(task: dict, filters: dict) -> bool:
-    """Check if a task matches the given filter criteria."""
-    status = filters.get("status", "uncompleted")
-    task_status = task.get("status", 0)
-    if status == "uncompleted" and task_status != 0:
-        return False
-    if status == "completed" and task_status != 2:
-        return False
-
-    title_contains = filters.get("title_contains")
-    if title_contains:
-        task_title = task.get("title") or ""
-        if title_contains.lower() not in task_title.lower():
-            return False
-
-    project_id = filters.get("project_id")
-    if project_id and task.get("projectId") != project_id:
-        return False
-
-    tag_label = filters.get("tag_label")
-    if tag_label:
-        task_tags = task.get("tags") or []
-        if tag_label not in task_tags:
-            return False
-
-    priority = filters.get("priority")
-    if priority is not None and task.get("priority") != priority:
-        return False
-
-    due_start = filters.get("due_start_date")
-    due_end = filters.get("due_end_date")
-    if due_start or due_end:
-        task_due = _parse_date(task.get("dueDate"))
-        if not task_due:
-            return False
-        if due_start:
-            filter_start = _parse_date(due_start)
-            if filter_start and task_due.date() < filter_start.date():
-                return False
-        if due_end:
-            filter_end = _parse_date(due_end)
-            if filter_end and task_due.date() > filter_end.date():
-                return False
-
-    comp_start = filters.get("completion_start_date")
-    comp_end = filters.get("completion_end_date")
-    if comp_start or comp_end:
-        task_completed = _parse_date(task.get("completedTime"))
-        if not task_completed:
-            return False
-        if comp_start:
-            filter_start = _parse_date(comp_start)
-            if filter_start and task_completed.date() < filter_start.date():
-                return False
-        if comp_end:
-            filter_end = _parse_date(comp_end)
-            if filter_end and task_completed.date() > filter_end.date():
-                return False
-
-    return True
-
-
 @mcp.tool()
-def unofficial_filter_tasks(
+async def unofficial_filter_tasks(
     status: str = "uncompleted",
     project_id: str | None = None,
     tag_label: str | None = None,
@@ -403,7 +1130,7 @@ def unofficial_filter_tasks(
     Use this instead of fetching all data.
 
     Searches across all projects and returns only tasks matching your filters.
-    Always returns fresh data (no caching). By default, only returns uncompleted tasks.
+    Data is at most a few seconds old. By default, only returns uncompleted tasks.
 
     IMPORTANT: Use this tool whenever you need to find, list, or browse tasks.
     Do NOT use get-all tools to retrieve tasks — use this with appropriate filters.
@@ -454,12 +1181,12 @@ def unofficial_filter_tasks(
         Get all tasks (completed + uncompleted) with a tag:
             unofficial_filter_tasks(status="all", tag_label="work")
     """
-    logger.info("unofficial_filter_tasks called")
+    logger.debug("unofficial_filter_tasks called")
 
     try:
         client = _get_api_client()
-        data = _fetch_all_data(client)
-        all_tasks = data.get("syncTaskBean", {}).get("update", [])
+        data = await _fetch_all_data(client)
+        all_tasks = _tasks_of(data)
 
         filters = {
             "status": status,
@@ -473,19 +1200,19 @@ def unofficial_filter_tasks(
             "completion_end_date": completion_end_date,
         }
 
-        filtered_tasks = [t for t in all_tasks if _matches_filter(t, filters)]
+        filtered_tasks = [t for t in all_tasks if matches_filter(t, filters)]
 
         if sort_by_priority:
             filtered_tasks.sort(key=lambda t: t.get("priority", 0), reverse=True)
 
-        logger.info(f"Filtered to {len(filtered_tasks)} tasks from {len(all_tasks)} total (fresh)")
+        logger.info("Filtered to %s tasks from %s total", len(filtered_tasks), len(all_tasks))
         return {
             "tasks": filtered_tasks,
             "total_count": len(filtered_tasks),
             "filters_applied": {k: v for k, v in filters.items() if v is not None}
         }
     except Exception as e:
-        logger.error(f"Failed to filter tasks: {e}")
+        logger.error("Failed to filter tasks: %s", e)
         return {"error": str(e)}
 
 
@@ -493,7 +1220,7 @@ def unofficial_filter_tasks(
 
 
 @mcp.tool()
-def unofficial_create_task(
+async def unofficial_create_task(
     title: str,
     project_id: str,
     content: str | None = None,
@@ -604,7 +1331,7 @@ def unofficial_create_task(
             specific_dates=["2026-02-05", "2026-02-10", "2026-02-15"]
         )
     """
-    logger.info(f"unofficial_create_task: {title}")
+    logger.debug("unofficial_create_task: %s", title)
 
     try:
         client = _get_api_client()
@@ -635,34 +1362,29 @@ def unofficial_create_task(
 
         # Handle specific dates (ERULE) - takes precedence over repeat_flag
         if specific_dates:
-            formatted_dates = sorted([d.replace("-", "") for d in specific_dates])
-            task["repeatFlag"] = f"ERULE:NAME=CUSTOM;BYDATE={','.join(formatted_dates)}"
-            first_date = min(specific_dates)
-            task["repeatFirstDate"] = f"{first_date}T05:00:00.000+0000"
-            task["repeatFrom"] = "0"
+            task.update(_specific_dates_fields(specific_dates))
         elif repeat_flag:
             task["repeatFlag"] = repeat_flag
             if repeat_from:
                 task["repeatFrom"] = _normalize_repeat_from(repeat_from)
 
-        payload = {"add": [task], "update": [], "delete": []}
-        result = client.call_api(BATCH_TASK, method="POST", data=payload)
+        payload = _batch_payload(add=[task])
+        result = await _post(client, BATCH_TASK, payload)
 
-        if isinstance(result, dict):
-            id2etag = result.get("id2etag", {})
-            if id2etag:
-                task_id = list(id2etag.keys())[0]
-                task["id"] = task_id
-                task["etag"] = id2etag[task_id]
+        id2etag = result.get("id2etag", {})
+        if id2etag:
+            task_id = next(iter(id2etag))
+            task["id"] = task_id
+            task["etag"] = id2etag[task_id]
 
         return {"success": True, "task": task}
     except Exception as e:
-        logger.error(f"Failed to create task: {e}")
+        logger.error("Failed to create task: %s", e)
         return {"error": str(e)}
 
 
 @mcp.tool()
-def unofficial_update_task(
+async def unofficial_update_task(
     task_id: str,
     title: str | None = None,
     content: str | None = None,
@@ -678,6 +1400,7 @@ def unofficial_update_task(
     repeat_from: str | None = None,
     specific_dates: list[str] | None = None,
     time_zone: str = "America/New_York",
+    etag: str | None = None,
 ) -> dict[str, Any]:
     """
     Update an existing task via the unofficial API.
@@ -752,6 +1475,9 @@ def unofficial_update_task(
             If provided, replaces any existing recurrence with an ERULE.
             Example: ["2026-02-05", "2026-02-10", "2026-02-15"]
         time_zone: Timezone (e.g., "America/New_York"). Always included when dates are updated.
+        etag: The task's current etag, if known (e.g. from a previous read or update).
+            When a local copy of the task with this etag is available, the update
+            starts from it instead of re-fetching the task.
 
     Returns:
         Updated task details
@@ -792,13 +1518,16 @@ def unofficial_update_task(
         # Set specific dates recurrence
         unofficial_update_task(task_id="abc123", specific_dates=["2026-03-01", "2026-03-15"])
     """
-    logger.info(f"unofficial_update_task called for task: {task_id}")
+    logger.debug("unofficial_update_task called for task: %s", task_id)
 
     try:
         client = _get_api_client()
 
-        # Direct fetch - works for completed AND incomplete tasks
-        task = client.call_api(f"/api/v2/task/{task_id}")
+        # Start from a known-current local copy if the caller's etag matches one,
+        # otherwise direct fetch - works for completed AND incomplete tasks
+        task = _find_task_with_etag(task_id, etag) if etag else None
+        if task is None:
+            task = await _get_task_for_update(client, task_id)
         if not task:
             return {"error": f"Task not found: {task_id}"}
 
@@ -838,11 +1567,7 @@ def unofficial_update_task(
 
         # Handle specific dates (ERULE) - takes precedence
         if specific_dates is not None:
-            formatted_dates = sorted([d.replace("-", "") for d in specific_dates])
-            task["repeatFlag"] = f"ERULE:NAME=CUSTOM;BYDATE={','.join(formatted_dates)}"
-            first_date = min(specific_dates)
-            task["repeatFirstDate"] = f"{first_date}T05:00:00.000+0000"
-            task["repeatFrom"] = "0"
+            task.update(_specific_dates_fields(specific_dates))
         else:
             # Handle repeat_flag update
             if repeat_flag is not None:
@@ -853,71 +1578,126 @@ def unofficial_update_task(
                 task["repeatFrom"] = _normalize_repeat_from(repeat_from)
 
         # Save via batch endpoint
-        payload = {"add": [], "update": [task], "delete": []}
-        result = client.call_api(BATCH_TASK, method="POST", data=payload)
-
-        if isinstance(result, dict) and task_id in result.get("id2etag", {}):
-            task["etag"] = result["id2etag"][task_id]
+        await _save_task(client, task)
 
         return {"success": True, "task": task}
     except Exception as e:
-        logger.error(f"Failed to update task: {e}")
+        logger.error("Failed to update task: %s", e)
         return {"error": str(e)}
 
 
 @mcp.tool()
-def unofficial_delete_task(task_id: str) -> dict[str, Any]:
+async def unofficial_delete_task(task_id: str, project_id: str | None = None) -> dict[str, Any]:
     """
     Delete a task via the unofficial API.
 
     Args:
         task_id: The task ID to delete
+        project_id: The task's project ID, if known. Saves looking the task up first.
 
     Returns:
         Success message or error
     """
-    logger.info(f"unofficial_delete_task called for task: {task_id}")
+    logger.debug("unofficial_delete_task called for task: %s", task_id)
 
     try:
         client = _get_api_client()
 
-        # Get the task first to find its project (fresh from API)
-        task = _get_task_by_id(client, task_id)
-        if not task:
-            return {"error": f"Task not found: {task_id}"}
+        # Otherwise take the project from a fresh snapshot, or get the task first
+        if project_id is None:
+            snapshot = _fresh_snapshot()
+            task = snapshot.get_task(task_id) if snapshot else None
+            if task is None:
+                task = await _get_task_by_id(client, task_id)
+            if not task:
+                return {"error": f"Task not found: {task_id}"}
+
+            project_id = task.get("projectId")
+            if not project_id:
+                return {"error": f"Task has no projectId: {task_id}"}
+
+        payload = _batch_payload(delete=[{"taskId": task_id, "projectId": project_id}])
+        result = await _post(client, BATCH_TASK, payload)
+        if result.get("id2error", {}).get(task_id):
+            return {"error": f"Delete failed: {result['id2error'][task_id]}"}
+        _forget_task(task_id)
+        logger.info("Successfully deleted task %s", task_id)
+        return {"success": True, "message": f"Task {task_id} deleted"}
+    except Exception as e:
+        logger.error("Failed to delete task: %s", e)
+        return {"error": str(e)}
 
-        project_id = task.get("projectId")
-        if not project_id:
-            return {"error": f"Task has no projectId: {task_id}"}
 
-        payload = {"add": [], "update": [], "delete": [{"taskId": task_id, "projectId": project_id}]}
-        client.call_api(BATCH_TASK, method="POST", data=payload)
-        logger.info(f"Successfully deleted task {task_id}")
-        return {"success": True, "message": f"Task {task_id} deleted"}
+@mcp.tool()
+async def unofficial_delete_tasks(task_ids: list[str]) -> dict[str, Any]:
+    """
+    Delete several tasks at once with a single batch request.
+
+    Prefer this over calling unofficial_delete_task repeatedly.
+
+    Args:
+        task_ids: The task IDs to delete
+
+    Returns:
+        Dict with deleted task IDs and per-task errors
+    """
+    logger.debug("unofficial_delete_tasks called for %s tasks", len(task_ids))
+
+    try:
+        client = _get_api_client()
+
+        # Each delete entry needs the task's projectId
+        tasks, errors = await _fetch_tasks(client, task_ids)
+        to_delete = []
+        for task in tasks:
+            if task.get("projectId"):
+                to_delete.append({"taskId": task["id"], "projectId": task["projectId"]})
+            else:
+                errors[task["id"]] = "Task has no projectId"
+
+        deleted = []
+        if to_delete:
+            result = await _post(client, BATCH_TASK, _batch_payload(delete=to_delete))
+            id2error = result.get("id2error", {})
+            for entry in to_delete:
+                _forget_task(entry["taskId"])
+                if id2error.get(entry["taskId"]):
+                    errors[entry["taskId"]] = str(id2error[entry["taskId"]])
+                else:
+                    deleted.append(entry["taskId"])
+
+        logger.info("Deleted %s of %s tasks", len(deleted), len(task_ids))
+        return {"success": not errors, "deleted": deleted, "errors": errors}
     except Exception as e:
-        logger.error(f"Failed to delete task: {e}")
+        logger.error("Failed to delete tasks: %s", e)
         return {"error": str(e)}
 
 
 @mcp.tool()
-def unofficial_move_task(task_id: str, to_project_id: str) -> dict[str, Any]:
+async def unofficial_move_task(
+    task_id: str,
+    to_project_id: str,
+    verify: bool = False
+) -> dict[str, Any]:
     """
     Move a task to a different project via the unofficial API.
 
     Args:
         task_id: The task ID to move
         to_project_id: The destination project ID
+        verify: If True, re-fetch the task from the server after the move
+                instead of returning the locally updated copy (default: False)
 
     Returns:
         Updated task or error
     """
-    logger.info(f"unofficial_move_task called: task={task_id}, to_project={to_project_id}")
+    logger.debug("unofficial_move_task called: task=%s, to_project=%s", task_id, to_project_id)
 
     try:
         client = _get_api_client()
 
         # Get the task first to find its current project
-        task = client.call_api(f"/api/v2/task/{task_id}")
+        task = await _get_task_by_id(client, task_id)
         if not task:
             return {"error": f"Task not found: {task_id}"}
 
@@ -929,29 +1709,33 @@ def unofficial_move_task(task_id: str, to_project_id: str) -> dict[str, Any]:
             "fromProjectId": from_project_id,
             "toProjectId": to_project_id
         }]
-        result = client.call_api(BATCH_TASK_PROJECT, method="POST", data=move_payload)
+        result = await _post(client, BATCH_TASK_PROJECT, move_payload)
+        _forget_task(task_id)
 
         # Verify the move worked
-        if isinstance(result, dict) and result.get("id2error", {}).get(task_id):
+        if result.get("id2error", {}).get(task_id):
             return {"error": f"Move failed: {result['id2error'][task_id]}"}
 
-        # Fetch updated task to return
-        updated_task = client.call_api(f"/api/v2/task/{task_id}")
+        if verify:
+            task = await _get_task_by_id(client, task_id)
+        else:
+            task["projectId"] = to_project_id
+            task["etag"] = result.get("id2etag", {}).get(task_id, task.get("etag"))
 
-        logger.info(f"Successfully moved task {task_id} from {from_project_id} to {to_project_id}")
+        logger.info("Successfully moved task %s from %s to %s", task_id, from_project_id, to_project_id)
         return {
             "success": True,
-            "task": updated_task,
+            "task": task,
             "moved_from": from_project_id,
             "moved_to": to_project_id
         }
     except Exception as e:
-        logger.error(f"Failed to move task: {e}")
+        logger.error("Failed to move task: %s", e)
         return {"error": str(e)}
 
 
 @mcp.tool()
-def unofficial_make_subtask(child_task_id: str, parent_task_id: str) -> dict[str, Any]:
+async def unofficial_make_subtask(child_task_id: str, parent_task_id: str) -> dict[str, Any]:
     """
     Make one task a subtask of another via the unofficial API.
 
@@ -979,17 +1763,15 @@ def unofficial_make_subtask(child_task_id: str, parent_task_id: str) -> dict[str
         # Parent now has childIds: [child_id]
         # Child now has parentId: parent_id
     """
-    logger.info(f"unofficial_make_subtask called: child={child_task_id}, parent={parent_task_id}")
+    logger.debug("unofficial_make_subtask called: child=%s, parent=%s", child_task_id, parent_task_id)
 
     try:
         client = _get_api_client()
 
-        # Get both tasks to verify they exist and are in same project
-        child = _get_task_by_id(client, child_task_id)
+        # Get both tasks (concurrently) to verify they exist and are in same project
+        child, parent = await _get_task_pair(client, child_task_id, parent_task_id)
         if not child:
             return {"error": f"Child task not found: {child_task_id}"}
-
-        parent = _get_task_by_id(client, parent_task_id)
         if not parent:
             return {"error": f"Parent task not found: {parent_task_id}"}
 
@@ -1004,16 +1786,18 @@ def unofficial_make_subtask(child_task_id: str, parent_task_id: str) -> dict[str
             "projectId": project_id,
             "taskId": child_task_id
         }]
-        result = client.call_api(BATCH_TASK_PARENT, method="POST", data=subtask_payload)
+        result = await _post(client, BATCH_TASK_PARENT, subtask_payload)
+        _forget_task(child_task_id)
+        _forget_task(parent_task_id)
 
         # Check for errors
-        if isinstance(result, dict) and result.get("id2error", {}).get(child_task_id):
+        if result.get("id2error", {}).get(child_task_id):
             return {"error": f"Make subtask failed: {result['id2error'][child_task_id]}"}
 
         # Extract updated info from response
-        id2etag = result.get("id2etag", {}) if isinstance(result, dict) else {}
+        id2etag = result.get("id2etag", {})
 
-        logger.info(f"Successfully made task {child_task_id} a subtask of {parent_task_id}")
+        logger.info("Successfully made task %s a subtask of %s", child_task_id, parent_task_id)
         return {
             "success": True,
             "message": f"Task is now a subtask",
@@ -1021,12 +1805,12 @@ def unofficial_make_subtask(child_task_id: str, parent_task_id: str) -> dict[str
             "child": id2etag.get(child_task_id, {})
         }
     except Exception as e:
-        logger.error(f"Failed to make subtask: {e}")
+        logger.error("Failed to make subtask: %s", e)
         return {"error": str(e)}
 
 
 @mcp.tool()
-def unofficial_remove_subtask(child_task_id: str) -> dict[str, Any]:
+async def unofficial_remove_subtask(child_task_id: str) -> dict[str, Any]:
     """
     Remove a subtask relationship, making the child a standalone task.
 
@@ -1039,13 +1823,13 @@ def unofficial_remove_subtask(child_task_id: str) -> dict[str, Any]:
     Returns:
         Dict with success status and updated task info
     """
-    logger.info(f"unofficial_remove_subtask called: child={child_task_id}")
+    logger.debug("unofficial_remove_subtask called: child=%s", child_task_id)
 
     try:
         client = _get_api_client()
 
         # Get the child task
-        child = _get_task_by_id(client, child_task_id)
+        child = await _get_task_by_id(client, child_task_id)
         if not child:
             return {"error": f"Child task not found: {child_task_id}"}
 
@@ -1060,20 +1844,22 @@ def unofficial_remove_subtask(child_task_id: str) -> dict[str, Any]:
             "projectId": project_id,
             "taskId": child_task_id
         }]
-        result = client.call_api(BATCH_TASK_PARENT, method="POST", data=subtask_payload)
+        result = await _post(client, BATCH_TASK_PARENT, subtask_payload)
+        _forget_task(child_task_id)
+        _forget_task(child["parentId"])
 
         # Check for errors
-        if isinstance(result, dict) and result.get("id2error", {}).get(child_task_id):
+        if result.get("id2error", {}).get(child_task_id):
             return {"error": f"Remove subtask failed: {result['id2error'][child_task_id]}"}
 
-        logger.info(f"Successfully removed subtask relationship for {child_task_id}")
+        logger.info("Successfully removed subtask relationship for %s", child_task_id)
         return {
             "success": True,
             "message": "Task is no longer a subtask",
             "task_id": child_task_id
         }
     except Exception as e:
-        logger.error(f"Failed to remove subtask: {e}")
+        logger.error("Failed to remove subtask: %s", e)
         return {"error": str(e)}
 
 
@@ -1081,7 +1867,7 @@ def unofficial_remove_subtask(child_task_id: str) -> dict[str, Any]:
 
 
 @mcp.tool()
-def unofficial_add_checklist_item(
+async def unofficial_add_checklist_item(
     task_id: str,
     title: str
 ) -> dict[str, Any]:
@@ -1104,13 +1890,13 @@ def unofficial_add_checklist_item(
             title="New step"
         )
     """
-    logger.info(f"unofficial_add_checklist_item called for task: {task_id}")
+    logger.debug("unofficial_add_checklist_item called for task: %s", task_id)
 
     try:
         client = _get_api_client()
 
         # Get the full task
-        task = client.call_api(f"/api/v2/task/{task_id}")
+        task = await _get_task_for_update(client, task_id)
         if not task:
             return {"error": f"Task not found: {task_id}"}
 
@@ -1121,26 +1907,22 @@ def unofficial_add_checklist_item(
         new_item = {"title": title, "status": 0}
         task["items"] = existing_items + [new_item]
 
-        # Update via batch endpoint
-        payload = {"add": [], "update": [task], "delete": []}
-        result = client.call_api(BATCH_TASK, method="POST", data=payload)
-
-        if isinstance(result, dict) and task_id in result.get("id2etag", {}):
-            task["etag"] = result["id2etag"][task_id]
+        # Update via batch endpoint. Not cached: the new item's ID only exists server-side.
+        await _save_task(client, task, cacheable=False)
 
-        logger.info(f"Successfully added checklist item to task {task_id}")
+        logger.info("Successfully added checklist item to task %s", task_id)
         return {
             "success": True,
             "task": task,
             "added_item": new_item
         }
     except Exception as e:
-        logger.error(f"Failed to add checklist item: {e}")
+        logger.error("Failed to add checklist item: %s", e)
         return {"error": str(e)}
 
 
 @mcp.tool()
-def unofficial_update_checklist_item(
+async def unofficial_update_checklist_item(
     task_id: str,
     item_id: str,
     title: str | None = None,
@@ -1173,13 +1955,13 @@ def unofficial_update_checklist_item(
             title="Updated step name"
         )
     """
-    logger.info(f"unofficial_update_checklist_item called for task: {task_id}, item: {item_id}")
+    logger.debug("unofficial_update_checklist_item called for task: %s, item: %s", task_id, item_id)
 
     try:
         client = _get_api_client()
 
         # Get the full task
-        task = client.call_api(f"/api/v2/task/{task_id}")
+        task = await _get_task_for_update(client, task_id)
         if not task:
             return {"error": f"Task not found: {task_id}"}
 
@@ -1204,24 +1986,20 @@ def unofficial_update_checklist_item(
         task["items"] = existing_items
 
         # Update via batch endpoint
-        payload = {"add": [], "update": [task], "delete": []}
-        result = client.call_api(BATCH_TASK, method="POST", data=payload)
+        await _save_task(client, task)
 
-        if isinstance(result, dict) and task_id in result.get("id2etag", {}):
-            task["etag"] = result["id2etag"][task_id]
-
-        logger.info(f"Successfully updated checklist item {item_id} in task {task_id}")
+        logger.info("Successfully updated checklist item %s in task %s", item_id, task_id)
         return {
             "success": True,
             "task": task
         }
     except Exception as e:
-        logger.error(f"Failed to update checklist item: {e}")
+        logger.error("Failed to update checklist item: %s", e)
         return {"error": str(e)}
 
 
 @mcp.tool()
-def unofficial_remove_checklist_item(
+async def unofficial_remove_checklist_item(
     task_id: str,
     item_id: str
 ) -> dict[str, Any]:
@@ -1241,13 +2019,13 @@ def unofficial_remove_checklist_item(
             item_id="item789"
         )
     """
-    logger.info(f"unofficial_remove_checklist_item called for task: {task_id}, item: {item_id}")
+    logger.debug("unofficial_remove_checklist_item called for task: %s, item: %s", task_id, item_id)
 
     try:
         client = _get_api_client()
 
         # Get the full task
-        task = client.call_api(f"/api/v2/task/{task_id}")
+        task = await _get_task_for_update(client, task_id)
         if not task:
             return {"error": f"Task not found: {task_id}"}
 
@@ -1265,25 +2043,21 @@ def unofficial_remove_checklist_item(
         task["items"] = updated_items
 
         # Update via batch endpoint
-        payload = {"add": [], "update": [task], "delete": []}
-        result = client.call_api(BATCH_TASK, method="POST", data=payload)
-
-        if isinstance(result, dict) and task_id in result.get("id2etag", {}):
-            task["etag"] = result["id2etag"][task_id]
+        await _save_task(client, task)
 
-        logger.info(f"Successfully removed checklist item {item_id} from task {task_id}")
+        logger.info("Successfully removed checklist item %s from task %s", item_id, task_id)
         return {
             "success": True,
             "task": task,
             "removed_item_id": item_id
         }
     except Exception as e:
-        logger.error(f"Failed to remove checklist item: {e}")
+        logger.error("Failed to remove checklist item: %s", e)
         return {"error": str(e)}
 
 
 @mcp.tool()
-def unofficial_convert_checklist_item_to_task(
+async def unofficial_convert_checklist_item_to_task(
     task_id: str,
     item_id: str
 ) -> dict[str, Any]:
@@ -1308,13 +2082,13 @@ def unofficial_convert_checklist_item_to_task(
         # result["new_task"] is the new standalone task
         # result["parent_task"] is the updated parent (without the item)
     """
-    logger.info(f"unofficial_convert_checklist_item_to_task called for task: {task_id}, item: {item_id}")
+    logger.debug("unofficial_convert_checklist_item_to_task called for task: %s, item: %s", task_id, item_id)
 
     try:
         client = _get_api_client()
 
         # Get the full task
-        task = client.call_api(f"/api/v2/task/{task_id}")
+        task = await _get_task_for_update(client, task_id)
         if not task:
             return {"error": f"Task not found: {task_id}"}
 
@@ -1350,21 +2124,20 @@ def unofficial_convert_checklist_item_to_task(
         task["items"] = updated_items
 
         # Batch update: add new task, update parent
-        payload = {"add": [new_task], "update": [task], "delete": []}
-        result = client.call_api(BATCH_TASK, method="POST", data=payload)
+        payload = _batch_payload(add=[new_task], update=[task])
+        result = await _post(client, BATCH_TASK, payload)
+        _forget_task(task_id)
 
         # Extract IDs from result
-        if isinstance(result, dict):
-            id2etag = result.get("id2etag", {})
-            for task_id_result, etag_info in id2etag.items():
-                if task_id_result == task_id:
-                    task["etag"] = etag_info if isinstance(etag_info, str) else etag_info.get("etag")
-                else:
-                    # This is the new task
-                    new_task["id"] = task_id_result
-                    new_task["etag"] = etag_info if isinstance(etag_info, str) else etag_info.get("etag")
+        for task_id_result, etag_info in result.get("id2etag", {}).items():
+            if task_id_result == task_id:
+                task["etag"] = etag_info if isinstance(etag_info, str) else etag_info.get("etag")
+            else:
+                # This is the new task
+                new_task["id"] = task_id_result
+                new_task["etag"] = etag_info if isinstance(etag_info, str) else etag_info.get("etag")
 
-        logger.info(f"Successfully converted checklist item {item_id} to task")
+        logger.info("Successfully converted checklist item %s to task", item_id)
         return {
             "success": True,
             "new_task": new_task,
@@ -1372,12 +2145,12 @@ def unofficial_convert_checklist_item_to_task(
             "converted_from_item": item_to_convert
         }
     except Exception as e:
-        logger.error(f"Failed to convert checklist item to task: {e}")
+        logger.error("Failed to convert checklist item to task: %s", e)
         return {"error": str(e)}
 
 
 @mcp.tool()
-def unofficial_convert_task_to_checklist_item(
+async def unofficial_convert_task_to_checklist_item(
     child_task_id: str,
     parent_task_id: str
 ) -> dict[str, Any]:
@@ -1400,17 +2173,15 @@ def unofficial_convert_task_to_checklist_item(
     Note:
         The original child task is DELETED and becomes embedded in the parent.
     """
-    logger.info(f"unofficial_convert_task_to_checklist_item called: child={child_task_id}, parent={parent_task_id}")
+    logger.debug("unofficial_convert_task_to_checklist_item called: child=%s, parent=%s", child_task_id, parent_task_id)
 
     try:
         client = _get_api_client()
 
-        # Get both tasks
-        child_task = client.call_api(f"/api/v2/task/{child_task_id}")
+        # Get both tasks (concurrently)
+        child_task, parent_task = await _get_task_pair(client, child_task_id, parent_task_id)
         if not child_task:
             return {"error": f"Child task not found: {child_task_id}"}
-
-        parent_task = client.call_api(f"/api/v2/task/{parent_task_id}")
         if not parent_task:
             return {"error": f"Parent task not found: {parent_task_id}"}
 
@@ -1437,17 +2208,18 @@ def unofficial_convert_task_to_checklist_item(
         parent_task["items"] = existing_items + [new_item]
 
         # Batch: update parent, delete child
-        payload = {
-            "add": [],
-            "update": [parent_task],
-            "delete": [{"taskId": child_task_id, "projectId": child_task.get("projectId")}]
-        }
-        result = client.call_api(BATCH_TASK, method="POST", data=payload)
+        payload = _batch_payload(
+            update=[parent_task],
+            delete=[{"taskId": child_task_id, "projectId": child_task.get("projectId")}]
+        )
+        result = await _post(client, BATCH_TASK, payload)
+        _forget_task(child_task_id)
+        _forget_task(parent_task_id)
 
-        if isinstance(result, dict) and parent_task_id in result.get("id2etag", {}):
+        if parent_task_id in result.get("id2etag", {}):
             parent_task["etag"] = result["id2etag"][parent_task_id]
 
-        logger.info(f"Successfully converted task {child_task_id} to checklist item of {parent_task_id}")
+        logger.info("Successfully converted task %s to checklist item of %s", child_task_id, parent_task_id)
         return {
             "success": True,
             "message": f"Task '{child_task.get('title')}' is now a checklist item of '{parent_task.get('title')}'",
@@ -1455,7 +2227,7 @@ def unofficial_convert_task_to_checklist_item(
             "note": "Original task was deleted and converted to a checklist item"
         }
     except Exception as e:
-        logger.error(f"Failed to convert task to checklist item: {e}")
+        logger.error("Failed to convert task to checklist item: %s", e)
         return {"error": str(e)}
 
 
@@ -1463,7 +2235,7 @@ def unofficial_convert_task_to_checklist_item(
 
 
 @mcp.tool()
-def unofficial_experimental_api_call(
+async def unofficial_experimental_api_call(
     endpoint: str,
     method: str = "GET",
     data: dict | list | None = None,
@@ -1481,14 +2253,32 @@ def unofficial_experimental_api_call(
     Returns:
         Raw API response or error dict
     """
-    logger.info(f"unofficial_experimental_api_call: {method} {endpoint}")
+    logger.debug("unofficial_experimental_api_call: %s %s", method, endpoint)
 
     try:
         client = _get_api_client()
 
-        result = client.call_api(endpoint, method=method, data=data, params=params)
-        logger.info(f"unofficial_experimental_api_call succeeded: {method} {endpoint}")
+        cache_key = (endpoint, repr(sorted((params or {}).items())))
+        if method == "GET" and EXPERIMENTAL_CACHE_ENABLED:
+            cached = _experimental_get_cache.get(cache_key)
+            if cached is not None and time.monotonic() - cached[0] < EXPERIMENTAL_CACHE_TTL:
+                logger.info("unofficial_experimental_api_call served from cache: %s", endpoint)
+                return cached[1]
+
+        generation = _write_generation
+        try:
+            result = await client.call_api_async(endpoint, method=method, data=data, params=params)
+        finally:
+            # A failed or cut-off write may still have landed server-side
+            if method != "GET":
+                _invalidate_batch_check_cache()
+        if method == "GET" and EXPERIMENTAL_CACHE_ENABLED and generation == _write_generation:
+            _experimental_get_cache[cache_key] = (time.monotonic(), result)
+            _experimental_get_cache.move_to_end(cache_key)
+            while len(_experimental_get_cache) > EXPERIMENTAL_CACHE_SIZE:
+                _experimental_get_cache.popitem(last=False)
+        logger.info("unofficial_experimental_api_call succeeded: %s %s", method, endpoint)
         return result
     except Exception as e:
-        logger.error(f"unofficial_experimental_api_call failed: {e}")
+        logger.error("unofficial_experimental_api_call failed: %s", e)
         return {"error": str(e)}
\ No newline at end of file
@@ -2,17 +2,27 @@
 TickTick Unofficial API Client.
 
 Direct API access without ticktick-py dependency.
-Handles authentication via username/password login and makes fresh API calls for all reads.
-NO CACHING - every read fetches fresh data from the API.
+Handles authentication via username/password login. The client itself keeps no
+response cache: every call_api()/call_api_async() goes to the server.
 
-This eliminates the stale cache problem that plagued the ticktick-py approach.
+Short-lived read caches live in tools/unofficial_tools.py instead, and every
+write through this server invalidates them (including reads still in flight):
+- batch/check snapshot: TICKTICK_MCP_SNAPSHOT_TTL seconds (default 3), refreshed
+  with checkpoint deltas and a full sync at least every 5 minutes
+- task activity logs: TICKTICK_MCP_ACTIVITY_TTL seconds (default 30)
+- identical experimental_api_call GETs: 1 second (TICKTICK_MCP_EXPERIMENTAL_CACHE)
+- tasks from our own last write: opt-in via TICKTICK_MCP_TASK_CACHE=1
 """
 
+import asyncio
 import logging
+import random
+import time
 from typing import Optional
 
 import httpx
 
+from ._http import HTTP2_AVAILABLE, HTTP_LIMITS, HTTP_TIMEOUT, decode_json, encode_json
 from .config import (
     USERNAME,
     PASSWORD,
@@ -20,19 +30,52 @@ from .config import (
 
 logger = logging.getLogger(__name__)
 
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def _parse_seconds(value: str | None) -> float | None:
+    """Parse a delay-seconds header value (e.g. Retry-After: 5); None if absent or not a number."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        return None  # HTTP-date form; plain backoff applies instead
+
 
 class UnofficialAPIClient:
     """
     Direct access to TickTick's unofficial v2 API.
     
     Key differences from the old ticktick-py based approach:
-    - No caching: Every read makes a fresh API call
+    - No response cache in the client: every call hits the API (the tools
+      layer keeps short, write-invalidated read caches on top)
     - Self-contained auth: No ticktick-py dependency
     - Generic call_api() method for all API operations
     """
     
     BASE_URL = "https://api.ticktick.com/api/v2/"
     BATCH_CHECK_URL = BASE_URL + "batch/check/0"
+
+    # Retry policy for call_api_async(): up to MAX_RETRIES more attempts on these
+    # statuses, waiting RETRY_BACKOFF * 2**attempt seconds plus up to RETRY_JITTER
+    # (so concurrent tool calls that failed together don't retry in lockstep).
+    # Only responses _is_retryable() accepts wait at all; a 5xx carrying a
+    # TickTick errorCode is returned to the caller immediately.
+    RETRY_STATUSES = (429, 500, 502, 503, 504)
+    MAX_RETRIES = 3
+    RETRY_BACKOFF = 0.5
+    RETRY_JITTER = 0.25
+    # Longest Retry-After we'll honor before giving the error back to the caller
+    MAX_RETRY_AFTER = 30.0
+
+    # Client-side pacing for call_api_async(): at most MAX_CONCURRENT_REQUESTS in
+    # flight (HTTP/2 multiplexes past the connection limit) and a token bucket of
+    # REQUEST_RATE requests/second with bursts up to REQUEST_BURST, so a wide
+    # fan-out slows itself down before the server starts answering 429
+    MAX_CONCURRENT_REQUESTS = 8
+    REQUEST_RATE = 10.0
+    REQUEST_BURST = 20
     
     # Headers that mimic the web app - copied exactly from ticktick-py
     USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/135.0.0.0 Safari/537.36'
@@ -61,10 +104,17 @@ class UnofficialAPIClient:
             return
         
         self._client: Optional[httpx.Client] = None
+        self._async_client: Optional[httpx.AsyncClient] = None
+        self._pause_until = 0.0  # monotonic time before which no request is sent (rate limiting)
+        self._request_slots = asyncio.Semaphore(self.MAX_CONCURRENT_REQUESTS)
+        self._login_lock = asyncio.Lock()
+        self._request_tokens = float(self.REQUEST_BURST)
+        self._request_tokens_at = time.monotonic()
         self._access_token: Optional[str] = None
         self._inbox_id: Optional[str] = None
         self._time_zone: Optional[str] = None
         self._profile_id: Optional[str] = None
+        self._startup_snapshot: Optional[tuple[float, dict]] = None
         
         if not all([USERNAME, PASSWORD]):
             logger.error("TickTick credentials not found. Set TICKTICK_USERNAME and TICKTICK_PASSWORD.")
@@ -73,9 +123,9 @@ class UnofficialAPIClient:
         
         try:
             self._initialize_client()
-            logger.info("Unofficial API client initialized successfully (no-cache mode)")
+            logger.info("Unofficial API client initialized successfully")
         except Exception as e:
-            logger.error(f"Error initializing unofficial client: {e}", exc_info=True)
+            logger.error("Error initializing unofficial client: %s", e, exc_info=True)
             self._client = None
         finally:
             UnofficialAPIClient._initialized = True
@@ -84,15 +134,19 @@ class UnofficialAPIClient:
         """
         Set up authenticated httpx client.
         
-        IMPORTANT: The OAuth2 token in .token-oauth is for the OFFICIAL API only.
+        IMPORTANT: The OAuth2 token (TICKTICK_OAUTH_TOKEN) is for the OFFICIAL API only.
         The unofficial API requires a SESSION token from /user/signon.
         We ALWAYS call _login() with username/password to get the session token.
         """
-        # Create httpx client with default headers
+        # Create httpx client with default headers.
+        # This one client (and its keep-alive pool) is reused by every call_api()
+        # for the life of the process, so tools only pay the TLS handshake once.
+        # Transport retries only cover failed connection attempts, never a sent request.
         self._client = httpx.Client(
             headers=self.DEFAULT_HEADERS,
-            timeout=30.0,
-            follow_redirects=True
+            timeout=HTTP_TIMEOUT,
+            follow_redirects=True,
+            transport=httpx.HTTPTransport(limits=HTTP_LIMITS, retries=2, http2=HTTP2_AVAILABLE),
         )
         
         # Always do username/password login to get session token
@@ -105,17 +159,21 @@ class UnofficialAPIClient:
         # Do initial sync to get inbox_id
         self._initial_sync()
     
+    def _signon_request(self) -> dict:
+        """Keyword arguments for the username/password signon POST."""
+        return {
+            "url": self.BASE_URL + "user/signon",
+            "params": {"wc": True, "remember": True},
+            "json": {
+                "username": USERNAME,
+                "password": PASSWORD
+            },
+        }
+
     def _login(self):
         """Authenticate with username/password to get session token."""
-        url = self.BASE_URL + "user/signon"
-        params = {"wc": True, "remember": True}
-        payload = {
-            "username": USERNAME,
-            "password": PASSWORD
-        }
-        
-        logger.info(f"Logging in as {USERNAME}")
-        response = self._client.post(url, json=payload, params=params)
+        logger.info("Logging in as %s", USERNAME)
+        response = self._client.post(**self._signon_request())
         
         if response.status_code != 200:
             raise RuntimeError(f"Login failed: {response.status_code} - {response.text[:200]}")
@@ -128,8 +186,38 @@ class UnofficialAPIClient:
         
         # Set the cookie for subsequent requests
         self._client.cookies.set("t", self._access_token)
-        logger.info("Login successful, session token obtained")
+        logger.info("Login successful, session token obtained (%s)", response.http_version)
     
+    async def _login_async(self, expired_token: Optional[str]):
+        """
+        Log in again on the async client after the session token expired.
+
+        Concurrent calls that hit the same 401 share one login: whoever gets
+        the lock second sees the token has already changed and returns.
+        """
+        async with self._login_lock:
+            if self._access_token != expired_token:
+                return
+            await self._refresh_session()
+
+    async def _refresh_session(self):
+        """Do the signon POST on the async client and install the new token."""
+        response = await self.async_client.post(**self._signon_request())
+
+        if response.status_code != 200:
+            raise RuntimeError(f"Login failed: {response.status_code} - {response.text[:200]}")
+
+        token = decode_json(response.content).get("token")
+        if not token:
+            raise RuntimeError("Login response missing token")
+
+        # Both clients carry the session cookie
+        self._access_token = token
+        self.async_client.cookies.set("t", token)
+        if self._client:
+            self._client.cookies.set("t", token)
+        logger.info("Session token refreshed")
+
     def _load_settings(self):
         """Load user settings (timezone, profile_id)."""
         url = self.BASE_URL + "user/preferences/settings"
@@ -138,22 +226,23 @@ class UnofficialAPIClient:
         response = self._client.get(url, params=params)
         
         if response.status_code != 200:
-            logger.warning(f"Failed to load settings: {response.status_code}")
+            logger.warning("Failed to load settings: %s", response.status_code)
             return
         
         data = response.json()
         self._time_zone = data.get("timeZone", "America/New_York")
         self._profile_id = data.get("id")
-        logger.info(f"Loaded settings: timezone={self._time_zone}")
+        logger.info("Loaded settings: timezone=%s", self._time_zone)
     
     def _initial_sync(self):
         """Do initial batch sync to get inbox_id and validate connection."""
         try:
             data = self._fetch_batch_check()
             self._inbox_id = data.get("inboxId")
-            logger.info(f"Initial sync complete, inbox_id={self._inbox_id}")
+            self._startup_snapshot = (time.monotonic(), data)
+            logger.info("Initial sync complete, inbox_id=%s", self._inbox_id)
         except Exception as e:
-            logger.warning(f"Initial sync failed: {e}")
+            logger.warning("Initial sync failed: %s", e)
     
     def _fetch_batch_check(self) -> dict:
         """
@@ -171,7 +260,7 @@ class UnofficialAPIClient:
         if response.status_code != 200:
             raise RuntimeError(f"Batch check failed: {response.status_code} - {response.text[:200]}")
         
-        return response.json()
+        return decode_json(response.content)
     
     @classmethod
     def get_instance(cls) -> Optional["UnofficialAPIClient"]:
@@ -190,6 +279,44 @@ class UnofficialAPIClient:
             raise RuntimeError("Unofficial client not initialized")
         return self._client
     
+    @property
+    def async_client(self) -> httpx.AsyncClient:
+        """
+        Get the authenticated async HTTP client used by the MCP tools.
+
+        Created on first use (inside the server's event loop) with the same
+        headers and session cookie as the sync client used for login. When h2
+        is installed, concurrent tool calls multiplex over one HTTP/2 connection.
+        """
+        if self._async_client is None:
+            self._async_client = httpx.AsyncClient(
+                headers=self.DEFAULT_HEADERS,
+                cookies={"t": self._access_token} if self._access_token else None,
+                timeout=HTTP_TIMEOUT,
+                follow_redirects=True,
+                transport=httpx.AsyncHTTPTransport(
+                    limits=HTTP_LIMITS, retries=2, http2=HTTP2_AVAILABLE
+                ),
+            )
+        return self._async_client
+
+    async def aclose(self) -> None:
+        """Close the async client's pooled connections (it is recreated on next use)."""
+        if self._async_client is not None:
+            client, self._async_client = self._async_client, None
+            await client.aclose()
+
+    def take_startup_snapshot(self) -> Optional[tuple[float, dict]]:
+        """
+        Hand over the batch/check payload fetched at startup, once.
+
+        Returns (monotonic fetch time, payload) so the first read can refresh
+        it with an incremental checkpoint sync instead of downloading
+        everything again; None if it was already taken or the sync failed.
+        """
+        snapshot, self._startup_snapshot = self._startup_snapshot, None
+        return snapshot
+
     @property
     def inbox_id(self) -> Optional[str]:
         """Get the inbox project ID."""
@@ -218,12 +345,14 @@ class UnofficialAPIClient:
         """
         url = f"https://api.ticktick.com{endpoint}"
 
+        body = encode_json(data) if data is not None else None
+
         if method == "GET":
             response = self.client.get(url, params=params)
         elif method == "POST":
-            response = self.client.post(url, json=data)
+            response = self.client.post(url, content=body, headers=_JSON_HEADERS)
         elif method == "PUT":
-            response = self.client.put(url, json=data)
+            response = self.client.put(url, content=body, headers=_JSON_HEADERS)
         elif method == "DELETE":
             response = self.client.delete(url)
         else:
@@ -232,7 +361,143 @@ class UnofficialAPIClient:
         if response.status_code != 200:
             raise RuntimeError(f"API error {response.status_code}: {response.text[:200]}")
 
-        return response.json() if response.content else {"status": "success"}
+        return decode_json(response.content) if response.content else {"status": "success"}
+
+    async def call_api_async(
+        self,
+        endpoint: str,
+        method: str = "GET",
+        data: dict | list | None = None,
+        params: dict | None = None
+    ) -> dict | list:
+        """
+        Async version of call_api(), so concurrent tool calls overlap on the wire.
+
+        Transient failures (429, or 5xx without a TickTick errorCode body) are
+        retried with exponential backoff so a tool call doesn't fail on a
+        momentary hiccup. A 401 (expired session)
+        triggers one fresh login and a resend. POSTs are only retried on
+        429, where the server rejected the request without applying it;
+        batch/task adds are not idempotent.
+
+        Args:
+            endpoint: API endpoint path (e.g., "/api/v2/batch/task")
+            method: HTTP method (GET, POST, PUT, DELETE)
+            data: Request body as JSON (for POST/PUT)
+            params: Query string parameters
+
+        Returns:
+            Response JSON
+        """
+        url = f"https://api.ticktick.com{endpoint}"
+        retry_statuses = (429,) if method == "POST" else self.RETRY_STATUSES
+
+        relogged_in = False
+        attempt = 0
+        while True:
+            # Honor a server-requested pause before sending anything else
+            pause = self._pause_until - time.monotonic()
+            if pause > 0:
+                await asyncio.sleep(pause)
+
+            token = self._access_token
+            async with self._request_slots:
+                await self._take_request_token()
+                response = await self._send_async(method, url, data, params)
+            self._note_rate_limit(response)
+
+            # Session token expired: log in again once and resend
+            if response.status_code == 401 and not relogged_in:
+                logger.warning("%s %s returned 401, refreshing session token", method, endpoint)
+                await self._login_async(token)
+                relogged_in = True
+                continue
+
+            if attempt == self.MAX_RETRIES or not self._is_retryable(response, retry_statuses):
+                break
+            delay = self.RETRY_BACKOFF * 2 ** attempt + random.uniform(0, self.RETRY_JITTER)
+            delay = max(delay, self._pause_until - time.monotonic())
+            logger.warning("%s %s returned %s, retrying in %.1fs", method, endpoint, response.status_code, delay)
+            await asyncio.sleep(delay)
+            attempt += 1
+
+        if response.status_code != 200:
+            raise RuntimeError(f"API error {response.status_code}: {response.text[:200]}")
+
+        return decode_json(response.content) if response.content else {"status": "success"}
+
+    @staticmethod
+    def _is_retryable(response: httpx.Response, retry_statuses: tuple[int, ...]) -> bool:
+        """
+        Whether another attempt could get a different answer.
+
+        TickTick reports application errors such as task_not_found as a 500
+        with a JSON errorCode body; those are final. Only 429s and 5xx
+        responses without one (gateway pages, empty bodies) are retried.
+        """
+        if response.status_code not in retry_statuses:
+            return False
+        if response.status_code == 429:
+            return True
+        try:
+            body = decode_json(response.content)
+        except ValueError:
+            return True
+        return not (isinstance(body, dict) and body.get("errorCode"))
+
+    async def _take_request_token(self) -> None:
+        """Wait until the token bucket allows another request, then spend one token."""
+        while True:
+            now = time.monotonic()
+            self._request_tokens = min(
+                float(self.REQUEST_BURST),
+                self._request_tokens + (now - self._request_tokens_at) * self.REQUEST_RATE,
+            )
+            self._request_tokens_at = now
+            if self._request_tokens >= 1:
+                self._request_tokens -= 1
+                return
+            await asyncio.sleep((1 - self._request_tokens) / self.REQUEST_RATE)
+
+    def _note_rate_limit(self, response: httpx.Response) -> None:
+        """
+        Pause all further calls if the server says we're being rate limited.
+
+        A Retry-After on a 429/503, or an exhausted X-RateLimit-Remaining with a
+        reset hint, sets a shared pause (capped at MAX_RETRY_AFTER seconds) so
+        concurrent tool calls wait instead of retrying into the limit.
+        """
+        headers = response.headers
+        wait = None
+        if response.status_code in (429, 503):
+            wait = _parse_seconds(headers.get("Retry-After"))
+        if wait is None and headers.get("X-RateLimit-Remaining") == "0":
+            wait = _parse_seconds(headers.get("Retry-After") or headers.get("X-RateLimit-Reset-After"))
+        if wait:
+            wait = min(wait, self.MAX_RETRY_AFTER)
+            self._pause_until = max(self._pause_until, time.monotonic() + wait)
+            logger.warning("Rate limited by TickTick, pausing requests for %.1fs", wait)
+
+    async def _send_async(
+        self,
+        method: str,
+        url: str,
+        data: dict | list | None,
+        params: dict | None
+    ) -> httpx.Response:
+        """Send a single request on the async client."""
+        client = self.async_client
+        body = encode_json(data) if data is not None else None
+
+        if method == "GET":
+            return await client.get(url, params=params)
+        elif method == "POST":
+            return await client.post(url, content=body, headers=_JSON_HEADERS)
+        elif method == "PUT":
+            return await client.put(url, content=body, headers=_JSON_HEADERS)
+        elif method == "DELETE":
+            return await client.delete(url)
+        raise ValueError(f"Unsupported method: {method}")
 
 
 
@@ -241,3 +506,10 @@ class UnofficialAPIClient:
 def get_client() -> Optional[UnofficialAPIClient]:
     """Get the unofficial API client instance."""
     return UnofficialAPIClient.get_instance()
+
+
+async def close_client() -> None:
+    """Close the unofficial client's async connections, if it was ever created."""
+    instance = UnofficialAPIClient._instance
+    if instance is not None and UnofficialAPIClient._initialized:
+        await instance.aclose()
@@ -0,0 +1,88 @@
+"""Shared fixtures. The HTTP layer is always faked; no test talks to TickTick."""
+
+import os
+
+# config.py exits at import time without these, and would otherwise look for a .env file
+for name in ("TICKTICK_CLIENT_ID", "TICKTICK_CLIENT_SECRET", "TICKTICK_REDIRECT_URI",
+             "TICKTICK_USERNAME", "TICKTICK_PASSWORD"):
+    os.environ.setdefault(name, "test")
+
+import asyncio
+
+import httpx
+import pytest
+
+from ticktick_mcp.tools import unofficial_tools
+from ticktick_mcp.unofficial_client import UnofficialAPIClient
+
+
+class FakeAPI:
+    """
+    Stands in for UnofficialAPIClient in tool-level tests.
+
+    `responses` maps an endpoint prefix to a value (or a callable taking the
+    endpoint). Endpoints listed in `gates` wait for that event before
+    answering, so a test can hold a read in flight.
+    """
+
+    def __init__(self):
+        self.calls: list[tuple[str, str]] = []
+        self.responses: dict = {}
+        self.gates: dict[str, asyncio.Event] = {}
+
+    async def call_api_async(self, endpoint, method="GET", data=None, params=None):
+        self.calls.append((method, endpoint))
+        for prefix, gate in self.gates.items():
+            if endpoint.startswith(prefix):
+                await gate.wait()
+        for prefix, response in self.responses.items():
+            if endpoint.startswith(prefix):
+                return response(endpoint) if callable(response) else response
+        return {"id2etag": {}, "id2error": {}}
+
+    def take_startup_snapshot(self):
+        return None
+
+
+@pytest.fixture
+def fake_api():
+    return FakeAPI()
+
+
+@pytest.fixture(autouse=True)
+def reset_tool_caches(monkeypatch):
+    """Give every test empty module-level caches."""
+    monkeypatch.setattr(unofficial_tools, "_batch_check_cache", {
+        "data": None, "ts": 0.0, "full_ts": 0.0, "index": None, "in_flight": None
+    })
+    monkeypatch.setattr(unofficial_tools, "_write_generation", 0)
+    unofficial_tools._activity_cache.clear()
+    unofficial_tools._activity_in_flight.clear()
+    unofficial_tools._experimental_get_cache.clear()
+    unofficial_tools._task_cache.clear()
+
+
+@pytest.fixture
+def api_client(monkeypatch):
+    """
+    A real UnofficialAPIClient with login skipped and no retry delays.
+
+    Call `api_client.mock(handler)` to route its async requests to an
+    httpx.MockTransport handler.
+    """
+    monkeypatch.setattr(UnofficialAPIClient, "_instance", None)
+    monkeypatch.setattr(UnofficialAPIClient, "_initialized", False)
+    monkeypatch.setattr(UnofficialAPIClient, "_initialize_client", lambda self: None)
+    monkeypatch.setattr(UnofficialAPIClient, "RETRY_BACKOFF", 0.0)
+    monkeypatch.setattr(UnofficialAPIClient, "RETRY_JITTER", 0.0)
+
+    client = UnofficialAPIClient()
+    client._access_token = "token"
+
+    def mock(handler):
+        client._async_client = httpx.AsyncClient(
+            transport=httpx.MockTransport(handler), cookies={"t": client._access_token}
+        )
+
+    client.mock = mock
+    return client
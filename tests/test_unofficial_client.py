@@ -0,0 +1,134 @@
+"""Retry, re-login and rate-limit behaviour of UnofficialAPIClient.call_api_async()."""
+
+import asyncio
+import time
+
+import httpx
+import pytest
+
+
+def _counting(handler):
+    """Wrap a MockTransport handler so the test can see how many requests it got."""
+    calls = []
+
+    def wrapped(request):
+        calls.append(request)
+        return handler(request)
+
+    return wrapped, calls
+
+
+def test_error_code_500_is_not_retried(api_client):
+    handler, calls = _counting(lambda request: httpx.Response(500, json={"errorCode": "task_not_found"}))
+    api_client.mock(handler)
+
+    with pytest.raises(RuntimeError, match="task_not_found"):
+        asyncio.run(api_client.call_api_async("/api/v2/task/missing"))
+
+    assert len(calls) == 1
+
+
+def test_5xx_without_error_code_is_retried(api_client):
+    def respond(request):
+        if len(calls) < 3:
+            return httpx.Response(503, text="<html>Service Unavailable</html>")
+        return httpx.Response(200, json={"ok": True})
+
+    handler, calls = _counting(respond)
+    api_client.mock(handler)
+
+    assert asyncio.run(api_client.call_api_async("/api/v2/batch/check/0")) == {"ok": True}
+    assert len(calls) == 3
+
+
+def test_retries_stop_after_max_retries(api_client):
+    handler, calls = _counting(lambda request: httpx.Response(502, text=""))
+    api_client.mock(handler)
+
+    with pytest.raises(RuntimeError, match="502"):
+        asyncio.run(api_client.call_api_async("/api/v2/batch/check/0"))
+
+    assert len(calls) == api_client.MAX_RETRIES + 1
+
+
+def test_post_is_only_retried_on_429(api_client):
+    handler, calls = _counting(lambda request: httpx.Response(503, text="busy"))
+    api_client.mock(handler)
+
+    with pytest.raises(RuntimeError, match="503"):
+        asyncio.run(api_client.call_api_async("/api/v2/batch/task", method="POST", data={}))
+
+    assert len(calls) == 1
+
+
+def test_post_without_data_sends_no_body(api_client):
+    handler, calls = _counting(lambda request: httpx.Response(200, json={}))
+    api_client.mock(handler)
+
+    asyncio.run(api_client.call_api_async("/api/v2/task/t1/pin", method="POST"))
+
+    assert calls[0].content == b""
+
+
+def test_concurrent_401s_share_one_login(api_client):
+    def respond(request):
+        if request.url.path.endswith("user/signon"):
+            return httpx.Response(200, json={"token": "fresh"})
+        if request.headers.get("cookie") != "t=fresh":
+            return httpx.Response(401, text="expired")
+        return httpx.Response(200, json={"ok": True})
+
+    handler, calls = _counting(respond)
+    api_client.mock(handler)
+
+    async def scenario():
+        return await asyncio.gather(*(api_client.call_api_async("/api/v2/batch/check/0") for _ in range(4)))
+
+    assert asyncio.run(scenario()) == [{"ok": True}] * 4
+    assert sum(request.url.path.endswith("user/signon") for request in calls) == 1
+
+
+def _timed(handler):
+    """Like _counting, but record when each request was sent."""
+    sent = []
+
+    def wrapped(request):
+        sent.append(time.monotonic())
+        return handler(request)
+
+    return wrapped, sent
+
+
+def test_retry_after_pauses_later_requests(api_client):
+    def respond(request):
+        if len(sent) == 1:
+            return httpx.Response(429, headers={"Retry-After": "0.2"}, text="slow down")
+        return httpx.Response(200, json={"ok": True})
+
+    handler, sent = _timed(respond)
+    api_client.mock(handler)
+    api_client.MAX_RETRIES = 0
+
+    async def scenario():
+        with pytest.raises(RuntimeError, match="429"):
+            await api_client.call_api_async("/api/v2/batch/check/0")
+        return await api_client.call_api_async("/api/v2/batch/check/0")
+
+    assert asyncio.run(scenario()) == {"ok": True}
+    assert sent[1] - sent[0] >= 0.2
+
+
+def test_requests_wait_once_token_bucket_is_empty(api_client):
+    handler, sent = _timed(lambda request: httpx.Response(200, json={"ok": True}))
+    api_client.mock(handler)
+    api_client.REQUEST_RATE = 20.0
+    api_client.REQUEST_BURST = 2
+    api_client._request_tokens = 2.0
+
+    async def scenario():
+        await asyncio.gather(*(api_client.call_api_async("/api/v2/batch/check/0") for _ in range(4)))
+
+    asyncio.run(scenario())
+
+    assert sent[1] - sent[0] < 0.05  # the burst goes out at once
+    assert sent[3] - sent[0] >= 0.09  # then one request per 1/REQUEST_RATE seconds
@@ -0,0 +1,297 @@
+"""Unofficial tools: read caches, update coalescing and batch-update checks."""
+
+import asyncio
+
+from ticktick_mcp.tools import unofficial_tools as ut
+
+
+def _snapshot(tasks, check_point=1, **extra):
+    return {"checkPoint": check_point, "inboxId": "inbox1", "syncTaskBean": {"update": tasks}, **extra}
+
+
+def _titles(data):
+    return {t["id"]: t["title"] for t in ut._tasks_of(data)}
+
+
+# ==================== Snapshot ====================
+
+
+def test_concurrent_reads_share_one_sync(fake_api):
+    fake_api.responses[ut.BATCH_CHECK] = _snapshot([{"id": "t1", "title": "a", "status": 0}])
+
+    async def scenario():
+        return await asyncio.gather(*(ut._fetch_all_data(fake_api) for _ in range(5)))
+
+    results = asyncio.run(scenario())
+
+    assert len(fake_api.calls) == 1
+    assert all(result is results[0] for result in results)
+
+
+def test_write_during_read_does_not_refill_snapshot(fake_api):
+    fake_api.responses[ut.BATCH_CHECK] = _snapshot([{"id": "t1", "title": "old", "status": 0}])
+
+    async def scenario():
+        fake_api.gates[ut.BATCH_CHECK] = gate = asyncio.Event()
+        read = asyncio.create_task(ut._fetch_all_data(fake_api))
+        await asyncio.sleep(0.01)
+
+        await ut._post(fake_api, ut.BATCH_TASK, ut._batch_payload(update=[{"id": "t1"}]))
+        gate.set()
+        stale = await read
+
+        fake_api.responses[ut.BATCH_CHECK] = _snapshot([{"id": "t1", "title": "new", "status": 0}], 2)
+        fresh = await ut._fetch_all_data(fake_api)
+        return stale, fresh
+
+    stale, fresh = asyncio.run(scenario())
+
+    # The caller already waiting gets what it asked for; the cache does not keep it
+    assert _titles(stale) == {"t1": "old"}
+    assert _titles(fresh) == {"t1": "new"}
+    assert [call for call in fake_api.calls if call[0] == "GET"] == [("GET", ut.BATCH_CHECK)] * 2
+
+
+def test_write_drops_in_flight_sync_for_new_readers(fake_api):
+    fake_api.responses[ut.BATCH_CHECK] = _snapshot([])
+
+    async def scenario():
+        fake_api.gates[ut.BATCH_CHECK] = gate = asyncio.Event()
+        first = asyncio.create_task(ut._fetch_all_data(fake_api))
+        await asyncio.sleep(0.01)
+        ut._invalidate_batch_check_cache()
+        second = asyncio.create_task(ut._fetch_all_data(fake_api))
+        await asyncio.sleep(0.01)
+        gate.set()
+        await asyncio.gather(first, second)
+
+    asyncio.run(scenario())
+
+    assert len([call for call in fake_api.calls if call[0] == "GET"]) == 2
+
+
+# ==================== Delta merge ====================
+
+
+BASE = _snapshot(
+    [{"id": "t1", "title": "a", "status": 0}, {"id": "t2", "title": "b", "status": 0}],
+    projectProfiles=[{"id": "p1"}, {"id": "p2"}],
+    tags=[{"name": "work"}],
+)
+
+
+def test_delta_with_partial_collection_needs_full_sync():
+    assert ut._merge_batch_check_delta(BASE, {"checkPoint": 2, "projectProfiles": [{"id": "p2"}]}) is None
+
+
+def test_delta_with_empty_collection_needs_full_sync():
+    assert ut._merge_batch_check_delta(BASE, {"checkPoint": 2, "tags": []}) is None
+
+
+def test_delta_merges_task_changes():
+    delta = {
+        "checkPoint": 2,
+        "syncTaskBean": {
+            "update": [
+                {"id": "t1", "title": "a2", "status": 0},
+                {"id": "t3", "title": "c", "status": 0},
+            ],
+            "delete": [{"taskId": "t2"}],
+        },
+    }
+
+    merged = ut._merge_batch_check_delta(BASE, delta)
+
+    assert _titles(merged) == {"t1": "a2", "t3": "c"}
+    assert merged["checkPoint"] == 2
+    assert merged["projectProfiles"] == BASE["projectProfiles"]
+    assert _titles(BASE) == {"t1": "a", "t2": "b"}  # base snapshot is left untouched
+
+
+def test_delta_drops_tasks_that_are_no_longer_open():
+    delta = {"checkPoint": 2, "syncTaskBean": {"update": [{"id": "t1", "title": "a", "status": 2}]}}
+
+    merged = ut._merge_batch_check_delta(BASE, delta)
+
+    assert _titles(merged) == {"t2": "b"}
+
+
+def test_unmergeable_delta_falls_back_to_full_sync(fake_api):
+    first = _snapshot([], 1, projectProfiles=[{"id": "p1"}, {"id": "p2"}])
+    full = _snapshot([], 3, projectProfiles=[{"id": "p2"}])
+    fake_api.responses[ut.BATCH_CHECK_SINCE.format(check_point=1)] = {"checkPoint": 2, "projectProfiles": [{"id": "p2"}]}
+
+    async def scenario():
+        fake_api.responses[ut.BATCH_CHECK] = first
+        await ut._fetch_all_data(fake_api)
+        ut._invalidate_batch_check_cache()
+        fake_api.responses[ut.BATCH_CHECK] = full
+        return await ut._fetch_all_data(fake_api)
+
+    assert asyncio.run(scenario()) is full
+    assert [endpoint for _, endpoint in fake_api.calls] == [
+        ut.BATCH_CHECK,
+        ut.BATCH_CHECK_SINCE.format(check_point=1),
+        ut.BATCH_CHECK,
+    ]
+
+
+# ==================== Activity ====================
+
+
+def test_write_during_activity_read_is_not_cached(fake_api):
+    activity = ut.TASK_ACTIVITY.format(task_id="t1")
+    fake_api.responses[activity] = [{"action": "T_CREATE"}]
+
+    async def scenario():
+        fake_api.gates[activity] = gate = asyncio.Event()
+        read = asyncio.create_task(ut._get_activity(fake_api, "t1"))
+        await asyncio.sleep(0.01)
+
+        await ut._post(fake_api, ut.BATCH_TASK, ut._batch_payload(update=[{"id": "t1"}]))
+        assert ut._activity_in_flight == {}
+        gate.set()
+        await read
+
+        assert "t1" not in ut._activity_cache
+        await ut._get_activity(fake_api, "t1")
+
+    asyncio.run(scenario())
+
+    assert fake_api.calls.count(("GET", activity)) == 2
+    assert "t1" in ut._activity_cache
+
+
+def test_repeat_activity_reads_are_cached(fake_api):
+    activity = ut.TASK_ACTIVITY.format(task_id="t1")
+    fake_api.responses[activity] = [{"action": "T_CREATE"}]
+
+    async def scenario():
+        await ut._get_activity(fake_api, "t1")
+        return await ut._get_activity(fake_api, "t1")
+
+    assert asyncio.run(scenario()) == [{"action": "T_CREATE"}]
+    assert fake_api.calls.count(("GET", activity)) == 1
+
+
+# ==================== Experimental API ====================
+
+
+def test_write_during_experimental_get_is_not_cached(fake_api, monkeypatch):
+    monkeypatch.setattr(ut, "_client_cache", fake_api)
+    fake_api.responses["/api/v2/user/preferences"] = {"timeZone": "UTC"}
+
+    async def scenario():
+        fake_api.gates["/api/v2/user/preferences"] = gate = asyncio.Event()
+        read = asyncio.create_task(ut.unofficial_experimental_api_call("/api/v2/user/preferences"))
+        await asyncio.sleep(0.01)
+
+        await ut._post(fake_api, ut.BATCH_TASK, ut._batch_payload(update=[{"id": "t1"}]))
+        gate.set()
+        await read
+
+        assert ut._experimental_get_cache == {}
+        await ut.unofficial_experimental_api_call("/api/v2/user/preferences")
+
+    asyncio.run(scenario())
+
+    assert fake_api.calls.count(("GET", "/api/v2/user/preferences")) == 2
+    assert len(ut._experimental_get_cache) == 1
+
+
+def test_failed_experimental_write_still_invalidates(fake_api, monkeypatch):
+    monkeypatch.setattr(ut, "_client_cache", fake_api)
+
+    def reject(endpoint):
+        raise RuntimeError("API error 500: timeout")
+
+    fake_api.responses[ut.BATCH_TASK] = reject
+    generation = ut._write_generation
+
+    result = asyncio.run(ut.unofficial_experimental_api_call(ut.BATCH_TASK, method="POST", data={}))
+
+    assert "error" in result
+    assert ut._write_generation == generation + 1
+
+
+# ==================== Update coalescing ====================
+
+
+def _posts(fake_api):
+    return [call for call in fake_api.calls if call[0] == "POST"]
+
+
+def test_queue_flushes_when_window_closes(fake_api):
+    queue = ut._BatchQueue(window=0.05)
+
+    async def scenario():
+        saves = asyncio.gather(*(queue.enqueue_update(fake_api, {"id": task_id}) for task_id in ("t1", "t2")))
+        await asyncio.sleep(0.01)
+        assert _posts(fake_api) == []
+        return await saves
+
+    asyncio.run(scenario())
+
+    assert _posts(fake_api) == [("POST", ut.BATCH_TASK)]
+
+
+def test_queue_gives_each_caller_its_own_entries(fake_api):
+    queue = ut._BatchQueue(window=0.01)
+    fake_api.responses[ut.BATCH_TASK] = {"id2etag": {"t1": "e1"}, "id2error": {"t2": "EXCEED_QUOTA"}}
+
+    async def scenario():
+        return await asyncio.gather(*(queue.enqueue_update(fake_api, {"id": task_id}) for task_id in ("t1", "t2")))
+
+    first, second = asyncio.run(scenario())
+
+    assert first == {"id2etag": {"t1": "e1"}, "id2error": {}}
+    assert second == {"id2etag": {}, "id2error": {"t2": "EXCEED_QUOTA"}}
+
+
+def test_queue_failure_reaches_every_caller(fake_api):
+    queue = ut._BatchQueue(window=0.01)
+
+    def fail(endpoint):
+        raise RuntimeError("API error 500: down")
+
+    fake_api.responses[ut.BATCH_TASK] = fail
+
+    async def scenario():
+        return await asyncio.gather(
+            *(queue.enqueue_update(fake_api, {"id": task_id}) for task_id in ("t1", "t2")),
+            return_exceptions=True,
+        )
+
+    results = asyncio.run(scenario())
+
+    assert [str(result) for result in results] == ["API error 500: down"] * 2
+
+
+def test_full_queue_flushes_before_window(fake_api):
+    queue = ut._BatchQueue(window=60.0, max_batch=50)
+
+    async def scenario():
+        saves = (queue.enqueue_update(fake_api, {"id": f"t{n}"}) for n in range(50))
+        return await asyncio.wait_for(asyncio.gather(*saves), timeout=1.0)
+
+    assert len(asyncio.run(scenario())) == 50
+    assert _posts(fake_api) == [("POST", ut.BATCH_TASK)]
+
+
+# ==================== Batch update ====================
+
+
+def test_batch_update_rejects_duplicates_and_etag(fake_api, monkeypatch):
+    monkeypatch.setattr(ut, "_client_cache", fake_api)
+
+    result = asyncio.run(ut.unofficial_batch_update_tasks([
+        {"id": "t1", "title": "a"},
+        {"id": "t1", "priority": 5},
+        {"id": "t2", "etag": "abc"},
+    ]))
+
+    assert result["updated"] == []
+    assert set(result["errors"]) == {"t1", "t2"}
+    assert "more than once" in result["errors"]["t1"]
+    assert "etag" in result["errors"]["t2"]
+    assert fake_api.calls == []